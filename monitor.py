@@ -0,0 +1,77 @@
+"""Run the service health monitor and the OpenAI network check in one process."""
+
+import asyncio
+import logging
+import signal
+
+from monitor_service import check_health, restart_service
+from network_monitor import check_openai_connection
+
+
+async def _sleep_or_stop(stop: asyncio.Event, seconds: float) -> bool:
+    """Sleep for ``seconds``; return True early if shutdown was requested."""
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=seconds)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def health_poll(stop: asyncio.Event) -> None:
+    """Check the chatbot service every minute and restart it when it fails."""
+    consecutive_failures = 0
+    max_failures = 3
+    check_interval = 60  # Check every minute
+
+    while not stop.is_set():
+        # The kept-alive connection in monitor_service is used from a worker thread.
+        if not await asyncio.to_thread(check_health):
+            consecutive_failures += 1
+            logging.warning(
+                f"Health check failed ({consecutive_failures}/{max_failures})"
+            )
+
+            if consecutive_failures >= max_failures:
+                logging.error("Maximum failures reached, attempting restart")
+                await asyncio.to_thread(restart_service)
+                consecutive_failures = 0
+                # Give service time to start
+                if await _sleep_or_stop(stop, 30):
+                    break
+        else:
+            if consecutive_failures > 0:
+                logging.info("Service recovered")
+            consecutive_failures = 0
+
+        if await _sleep_or_stop(stop, check_interval):
+            break
+
+
+async def openai_poll(stop: asyncio.Event) -> None:
+    """Log connectivity to the OpenAI API every minute."""
+    while not stop.is_set():
+        # Shares network_monitor's cached getaddrinfo result and address retry
+        result = await asyncio.to_thread(check_openai_connection)
+        if result["status"]:
+            logging.info(result["message"])
+        else:
+            logging.warning(result["message"])
+
+        if await _sleep_or_stop(stop, 60):
+            break
+
+
+async def main() -> None:
+    """Run both monitors on one event loop until SIGINT/SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    logging.info("Starting service monitor...")
+    await asyncio.gather(health_poll(stop), openai_poll(stop))
+    logging.info("Monitor shutting down")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,15 @@
 """Monitor and maintain the Dinesh Assistant service."""
 
+import http.client
 import logging
 import os
+import selectors
+import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
 
-import requests
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,13 +21,67 @@ logging.basicConfig(
 )
 
 
-def check_health() -> bool:
-    """Check if the service is healthy."""
+# One keep-alive connection to the local service, reused every check.
+_CONN = http.client.HTTPConnection("localhost", 8000, timeout=2)
+
+# Errors from reusing a connection the server has already closed.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+# Last health check result, reused by callers that pass a TTL.
+_health_cache = {"fetched_at": 0.0, "value": None}
+
+
+def _reconnect() -> None:
+    """Replace the kept-alive connection with a fresh one."""
+    global _CONN
+    _CONN.close()
+    _CONN = http.client.HTTPConnection("localhost", 8000, timeout=2)
+
+
+def _probe() -> bool:
+    """Request /health on the kept-alive connection."""
+    _CONN.request("GET", "/health")
+    response = _CONN.getresponse()
+    response.read()  # Drain the body so the connection can be reused
+    return response.status == 200
+
+
+def check_health(ttl_ms: int = 0) -> bool:
+    """Check if the service is healthy.
+
+    Args:
+        ttl_ms: Reuse the previous result if it is younger than this many
+            milliseconds. The default of 0 always probes the service.
+    """
+    if (
+        ttl_ms > 0
+        and _health_cache["value"] is not None
+        and time.monotonic() * 1000 - _health_cache["fetched_at"] < ttl_ms
+    ):
+        return _health_cache["value"]
+
     try:
-        response = requests.get("http://localhost:8000/health")
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+        try:
+            healthy = _probe()
+        except _STALE_CONNECTION_ERRORS:
+            # The server closed the idle keep-alive connection (uvicorn does
+            # after 5s); that says nothing about its health, so retry once.
+            _reconnect()
+            healthy = _probe()
+    except (http.client.HTTPException, OSError):
+        # Start over with a fresh connection on the next check.
+        _reconnect()
+        healthy = False
+
+    # Stamp after the request so slow probes don't shorten the TTL.
+    _health_cache["fetched_at"] = time.monotonic() * 1000
+    _health_cache["value"] = healthy
+    return healthy
 
 
 def restart_service() -> None:
@@ -50,11 +105,40 @@ def restart_service() -> None:
         logging.error(f"Failed to restart service: {e}")
 
 
+def _shutdown_selector() -> selectors.BaseSelector:
+    """Return a selector that becomes readable when SIGINT/SIGTERM arrive."""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        # A no-op handler; the wakeup fd is what interrupts the wait.
+        signal.signal(signum, lambda *_: None)
+
+    selector = selectors.DefaultSelector()
+    selector.register(read_fd, selectors.EVENT_READ)
+    return selector
+
+
+def _wait_for_shutdown(selector: selectors.BaseSelector, timeout: float) -> bool:
+    """Block for up to ``timeout`` seconds; return True if a signal arrived."""
+    for key, _ in selector.select(timeout=timeout):
+        while True:
+            try:
+                if not os.read(key.fd, 512):
+                    break
+            except BlockingIOError:
+                break
+        return True
+    return False
+
+
 def main():
     """Main monitoring loop."""
     consecutive_failures = 0
     max_failures = 3
     check_interval = 60  # Check every minute
+    selector = _shutdown_selector()
 
     logging.info("Starting service monitor...")
 
@@ -69,13 +153,18 @@ def main():
                 logging.error("Maximum failures reached, attempting restart")
                 restart_service()
                 consecutive_failures = 0
-                time.sleep(30)  # Give service time to start
+                # Give service time to start
+                if _wait_for_shutdown(selector, 30):
+                    break
         else:
             if consecutive_failures > 0:
                 logging.info("Service recovered")
             consecutive_failures = 0
 
-        time.sleep(check_interval)
+        if _wait_for_shutdown(selector, check_interval):
+            break
+
+    logging.info("Monitor shutting down")
 
 
 if __name__ == "__main__":
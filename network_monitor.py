@@ -3,7 +3,7 @@
 import logging
 import socket
 import time
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -13,13 +13,40 @@ logging.basicConfig(
 )
 
 
+# Resolved addresses of the OpenAI endpoint, refreshed every _ADDR_TTL seconds.
+_ADDR_CACHE: Dict[str, Any] = {"at": 0.0, "info": None}
+_ADDR_TTL = 300
+
+
+def _resolve_openai_addresses() -> List[Tuple]:
+    """Return the cached ``getaddrinfo`` entries for the OpenAI API endpoint."""
+    now = time.monotonic()
+    if _ADDR_CACHE["info"] is None or now - _ADDR_CACHE["at"] > _ADDR_TTL:
+        _ADDR_CACHE["info"] = socket.getaddrinfo(
+            "api.openai.com", 443, type=socket.SOCK_STREAM
+        )
+        _ADDR_CACHE["at"] = now
+    return _ADDR_CACHE["info"]
+
+
 def check_openai_connection() -> Dict[str, Union[bool, str]]:
     """Check connection to OpenAI services."""
     try:
-        # Try to connect to OpenAI's API
-        socket.create_connection(("api.openai.com", 443), timeout=3)
-        return {"status": True, "message": "Connection to OpenAI is available"}
+        # Try each resolved address in turn, as socket.create_connection does,
+        # so an unreachable IPv6 entry listed first doesn't fail the check.
+        error: Optional[OSError] = None
+        for family, type_, proto, _, sockaddr in _resolve_openai_addresses():
+            try:
+                with socket.socket(family, type_, proto) as sock:
+                    sock.settimeout(3)
+                    sock.connect(sockaddr)
+                return {"status": True, "message": "Connection to OpenAI is available"}
+            except OSError as e:
+                error = e
+        raise error or OSError("getaddrinfo returned no addresses")
     except OSError as e:
+        # Re-resolve on the next check in case the cached addresses went stale.
+        _ADDR_CACHE["info"] = None
         return {"status": False, "message": f"Cannot connect to OpenAI: {str(e)}"}
 
 
@@ -8,10 +8,10 @@ setup(
     packages=find_packages(),
     install_requires=[
         "fastapi",
-        "uvicorn",
+        "uvicorn[standard]",
         "jinja2",
         "python-multipart",
         "aiofiles",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 )
@@ -4,14 +4,668 @@ This module implements an advanced chatbot assistant to provide natural,
 contextual responses about the project, features, and development assistance.
 """
 
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
-
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .config.settings import AppConfig
 from .training.core_responses import GREETING_RESPONSE
+from .training.keyword_matcher import KeywordMatcher
 from .training.topic_manager import TopicManager
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, AsyncStream
+    from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
+
+logger = logging.getLogger(__name__)
+
+# Keyword tiers per topic; only "primary" and "secondary" drive topic extraction.
+_TOPIC_PATTERNS: Dict[str, Dict[str, List[str]]] = {
+    "python": {
+        "primary": ["python", "code", "programming", "script"],
+        "secondary": ["development", "type hints", "async", "test"],
+        "layman": [
+            "write a program",
+            "create something",
+            "build",
+            "make",
+            "fix code",
+        ],
+    },
+    "mcp": {
+        "primary": ["mcp", "model context protocol", "smart server"],
+        "secondary": ["server", "integration", "context", "connect"],
+        "layman": ["ai connection", "smart system", "brain", "intelligence"],
+    },
+    "identity": {
+        "primary": ["powered by", "who are you", "what are you", "your name"],
+        "secondary": ["capabilities", "features", "can you", "help me"],
+        "layman": [
+            "what can you do",
+            "how do you work",
+            "tell me about yourself",
+        ],
+    },
+    "architecture": {
+        "primary": ["architecture", "structure", "design", "system"],
+        "secondary": ["organization", "pattern", "flow", "layout"],
+        "layman": ["how does it work", "explain the system", "show me around"],
+    },
+    "web": {
+        "primary": ["web", "api", "endpoint", "http", "fastapi"],
+        "secondary": ["server", "route", "request", "response"],
+        "layman": ["website", "webpage", "online", "internet", "web service"],
+    },
+    "deployment": {
+        "primary": ["deploy", "install", "setup", "configuration"],
+        "secondary": ["launch", "start", "run", "execute"],
+        "layman": ["get it running", "make it work", "start the system"],
+    },
+    "error": {
+        "primary": ["error", "bug", "issue", "problem", "crash"],
+        "secondary": ["not working", "fails", "wrong", "incorrect"],
+        "layman": [
+            "broken",
+            "doesn't work",
+            "help me fix",
+            "something's wrong",
+        ],
+    },
+    "documentation": {
+        "primary": ["docs", "documentation", "guide", "tutorial"],
+        "secondary": ["example", "explanation", "reference"],
+        "layman": ["show me how", "teach me", "learn about", "understand"],
+    },
+}
+
+_GREETING_TEXT = (
+    "Hello! 👋 I'm your AI assistant. Let me help you with:\n\n"
+    "1. 🚀 Technical Implementation\n"
+    "   • Python development and best practices\n"
+    "   • FastAPI and web services\n"
+    "   • Testing and quality assurance\n\n"
+    "2. � Project Features\n"
+    "   • GitHub integration and CI/CD\n"
+    "   • MCP server deployment\n"
+    "   • Hybrid architecture\n\n"
+    "3. 🤖 AI Integration\n"
+    "   • Context management\n"
+    "   • Enhanced responses\n"
+    "   • Intelligent assistance\n\n"
+    "4. �️ Development Support\n"
+    "   • Error troubleshooting\n"
+    "   • Performance optimization\n"
+    "   • Security best practices\n\n"
+    "How can I assist you today? Feel free to ask in your own words! 😊"
+)
+
+# Technical domains and their keyword tiers, scored by _DOMAIN_TIER_WEIGHTS.
+_DOMAIN_PATTERNS: Dict[str, Dict[str, List[str]]] = {
+    "python": {
+        "keywords": ["python", "code", "function", "class", "method"],
+        "phrases": ["write a program", "create a script", "python code"],
+        "concepts": ["object oriented", "inheritance", "variables"],
+        "layman": ["make it work", "write something", "program logic"],
+    },
+    "web": {
+        "keywords": ["api", "endpoint", "http", "fastapi", "route"],
+        "phrases": ["web service", "api endpoint", "http request"],
+        "concepts": ["rest", "http methods", "api design"],
+        "layman": ["website", "web page", "internet", "online"],
+    },
+    "github": {
+        "keywords": ["git", "github", "commit", "push", "pull"],
+        "phrases": ["version control", "source code", "repository"],
+        "concepts": ["branching", "merging", "collaboration"],
+        "layman": ["save changes", "track code", "backup code"],
+    },
+    "ai": {
+        "keywords": ["model", "ml", "train", "predict", "ai"],
+        "phrases": ["machine learning", "artificial intelligence"],
+        "concepts": ["neural network", "deep learning", "training"],
+        "layman": ["smart system", "intelligence", "learning"],
+    },
+    "architecture": {
+        "keywords": ["design", "structure", "pattern", "component"],
+        "phrases": ["system design", "project structure"],
+        "concepts": ["modularity", "scalability", "patterns"],
+        "layman": ["how it works", "system layout", "organization"],
+    },
+    "testing": {
+        "keywords": ["test", "pytest", "coverage", "assert"],
+        "phrases": ["unit test", "integration test"],
+        "concepts": ["test cases", "mocking", "fixtures"],
+        "layman": ["check if it works", "verify", "validate"],
+    },
+    "deployment": {
+        "keywords": ["deploy", "server", "cloud", "container"],
+        "phrases": ["production environment", "deployment process"],
+        "concepts": ["continuous integration", "automation"],
+        "layman": ["put online", "make live", "launch"],
+    },
+}
+
+# Direct keywords weigh most, then phrases, concepts and layman terms.
+_DOMAIN_TIER_WEIGHTS: Dict[str, float] = {
+    "keywords": 3,
+    "phrases": 2,
+    "concepts": 1,
+    "layman": 0.5,
+}
+
+# Direct AI keywords that strongly suggest OpenAI usage
+_AI_KEYWORDS: Tuple[str, ...] = (
+    "generate",
+    "create",
+    "write",
+    "analyze",
+    "summarize",
+    "explain in detail",
+    "compare",
+    "improve",
+    "suggest",
+    "how would you",
+    "what do you think",
+    "complex",
+    "advanced",
+    "ai",
+    "intelligence",
+)
+
+# Contextual keywords that might benefit from AI
+_CONTEXTUAL_KEYWORDS: Tuple[str, ...] = (
+    "why",
+    "how come",
+    "what if",
+    "explain",
+    "understand",
+    "help me with",
+    "show me how",
+    "can you help",
+    "best way to",
+    "alternative",
+    "better way",
+    "optimize",
+    "improve",
+)
+
+# Complex question indicators
+_COMPLEX_PATTERNS: Tuple[str, ...] = (
+    "difference between",
+    "compare and contrast",
+    "pros and cons",
+    "advantages and disadvantages",
+    "step by step",
+    "in depth",
+    "detailed explanation",
+)
+
+# Seconds a network probe result is reused before probing again.
+_NETWORK_CHECK_TTL = 30
+
+# Greeting phrases; a query that is exactly one of these skips the pipeline.
+_GREETINGS = frozenset(
+    {
+        "hi",
+        "hello",
+        "hey",
+        "greetings",
+        "good morning",
+        "good afternoon",
+        "good evening",
+        "hi there",
+        "hello there",
+        "howdy",
+    }
+)
+
+# Cheap prefix test run before normalising a query for the greeting lookup.
+_GREETING_STARTS = tuple(sorted({greeting.split()[0] for greeting in _GREETINGS}))
+
+# Whole-word greetings, so words like "this" or "which" do not count as "hi".
+_GREETING_RE = re.compile(
+    r"\b(?:hi|hello|hey|greetings|howdy|good (?:morning|afternoon|evening))\b"
+)
+
+# Words that mark a query as being about an error; matched as substrings.
+_ERROR_QUERY_KEYWORDS: Tuple[str, ...] = ("error", "bug", "issue", "problem", "fix")
+
+# Phrases asking what the assistant can do; matched as substrings.
+_CAPABILITY_KEYWORDS: Tuple[str, ...] = (
+    "can you",
+    "what can",
+    "help me",
+    "your capabilities",
+    "what do you do",
+    "how do you",
+    "abilities",
+)
+
+# Query feature flags, combined into one int per query by _query_features.
+_F_IDENTITY = 1 << 0
+_F_MCP = 1 << 1
+_F_PYTHON = 1 << 2
+_F_ERROR = 1 << 3
+_F_GREETING = 1 << 4
+_F_DOMAIN = 1 << 5
+_F_CAPABILITY = 1 << 6
+
+# Fixed reply texts shared by every assistant instance.
+_IDENTITY_TEXT = (
+    "I'm your project-specific AI assistant, focused on helping you understand "
+    "and work with this codebase effectively. I can help with:\n\n"
+    "1. Python development best practices\n"
+    "2. Project architecture and components\n"
+    "3. Error analysis and troubleshooting\n"
+    "4. Documentation and knowledge sharing\n\n"
+    "How can I assist you with the project today?"
+)
+
+_CAPABILITY_TEXT = (
+    "I can help you with:\n"
+    "1. Python programming questions and issues\n"
+    "2. GitHub-related tasks and queries\n"
+    "3. CI/CD pipeline setup and troubleshooting\n"
+    "4. Model Context Protocol (MCP) implementation\n"
+    "5. General programming assistance and error analysis\n\n"
+    "What would you like to know more about?"
+)
+
+_MCP_PYTHON_TEXT = (
+    "Let me explain how this project leverages both Python and MCP server capabilities:\n\n"
+    "1. Modern Python Development 🐍\n"
+    "   • Type hints for enhanced code safety\n"
+    "   • Async/await for efficient async operations\n"
+    "   • Latest Python 3.8+ features for better performance\n"
+    "   • Comprehensive testing with pytest\n\n"
+    "2. MCP Server Integration 🔄\n"
+    "   • FastAPI-based implementation for high performance\n"
+    "   • Context-aware response handling\n"
+    "   • Efficient state management\n"
+    "   • Domain-specific knowledge integration\n\n"
+    "3. Development Workflow ⚙️\n"
+    "   • Code quality tools: mypy, black, isort\n"
+    "   • Automated testing and CI/CD\n"
+    "   • Clear documentation standards\n"
+    "   • Modular project structure\n\n"
+    "4. Key Features 🎯\n"
+    "   • Intelligent response generation\n"
+    "   • Enhanced context management\n"
+    "   • Multi-domain knowledge support\n"
+    "   • Error handling and recovery\n\n"
+    "Would you like to explore any specific aspect in more detail?"
+)
+
+_OFFLINE_TEXT = (
+    "I notice your question might benefit from AI-powered analysis, but I'm currently in offline mode. "
+    "I'll help you with my local knowledge base instead.\n\n"
+    "For best results with complex queries, please try again when network connectivity is better."
+)
+
+_ERROR_HELP_TEXT = (
+    "I'll help you troubleshoot this issue. Could you please:\n"
+    "1. Share the exact error message\n"
+    "2. Describe what you were trying to do\n"
+    "3. Show me the relevant code section"
+)
+
+# Error explanations, formatted with the offending query.
+_RUNTIME_ERROR_TEMPLATE = (
+    "🔍 I noticed a runtime error. Let me help you fix that:\n\n"
+    "Error: {error}\n\n"
+    "Common causes:\n"
+    "1. Invalid operations\n"
+    "2. Resource unavailability\n"
+    "3. State inconsistencies\n\n"
+    "Suggested solutions:\n"
+    "1. Check input validation\n"
+    "2. Verify resource availability\n"
+    "3. Add proper error handling\n\n"
+    "Would you like me to show you an example of proper error handling?"
+)
+
+_IMPORT_ERROR_TEMPLATE = (
+    "📦 Looks like we have an import issue. Let's resolve it:\n\n"
+    "Error: {error}\n\n"
+    "This usually means:\n"
+    "1. A package is not installed\n"
+    "2. Python path is incorrect\n"
+    "3. Virtual environment is not activated\n\n"
+    "Quick fix steps:\n"
+    "1. Check requirements.txt\n"
+    "2. Verify virtual environment\n"
+    "3. Install missing packages\n\n"
+    "Would you like me to help you install the required packages?"
+)
+
+_SYNTAX_ERROR_TEMPLATE = (
+    "🔧 I found a syntax error. Let me help you fix it:\n\n"
+    "Error: {error}\n\n"
+    "Common issues:\n"
+    "1. Missing parentheses/brackets\n"
+    "2. Incorrect indentation\n"
+    "3. Invalid Python syntax\n\n"
+    "Best practices:\n"
+    "1. Use a code formatter (black)\n"
+    "2. Enable syntax highlighting\n"
+    "3. Check indentation carefully\n\n"
+    "Would you like me to show you the correct syntax?"
+)
+
+_TYPE_ERROR_TEMPLATE = (
+    "📝 I noticed a type error. Let's fix it properly:\n\n"
+    "Error: {error}\n\n"
+    "This typically means:\n"
+    "1. Incompatible types used\n"
+    "2. Missing type conversions\n"
+    "3. Incorrect method usage\n\n"
+    "Modern Python solutions:\n"
+    "1. Use type hints\n"
+    "2. Add runtime type checking\n"
+    "3. Implement proper validation\n\n"
+    "Would you like to see how to use type hints correctly?"
+)
+
+_VALUE_ERROR_TEMPLATE = (
+    "⚠️ I found a value error. Let's handle it properly:\n\n"
+    "Error: {error}\n\n"
+    "Common causes:\n"
+    "1. Invalid input values\n"
+    "2. Incorrect data format\n"
+    "3. Missing validation\n\n"
+    "Best practices:\n"
+    "1. Add input validation\n"
+    "2. Use data validation libraries\n"
+    "3. Implement error boundaries\n\n"
+    "Would you like to see examples of proper validation?"
+)
+
+# System message sent with every OpenAI request; kept byte-identical.
+_SYSTEM_PROMPT = "You are a technical assistant specialized in Python development."
+
+# Guidance for each technical domain; only the query's own goes into a prompt.
+_DOMAIN_CONTEXTS: Mapping[str, str] = MappingProxyType(
+    {
+        "python": "Focus on Python best practices, modern features, and clean code.",
+        "web": "Consider FastAPI, API design, and web service architecture.",
+        "github": "Include Git workflow, collaboration, and version control aspects.",
+        "ai": "Focus on AI/ML implementation and integration details.",
+        "architecture": "Consider system design, patterns, and architectural principles.",
+        "testing": "Emphasize testing practices, coverage, and quality assurance.",
+        "deployment": "Focus on deployment, CI/CD, and operational aspects.",
+    }
+)
+
+# Stable part of every OpenAI prompt. It comes first and never varies, so
+# the provider's automatic prefix caching can reuse it across requests. It is
+# well under the 1024-token caching threshold, so it holds nothing that a
+# given request does not need; the domain guidance follows it per request.
+_PROMPT_PREFIX = (
+    "You are a technical assistant helping with a Python project. "
+    "Your responses should be clear, accurate, and helpful.\n"
+    "Provide a detailed, well-structured response. "
+    "Include relevant examples and best practices. "
+    "If discussing code, provide clear, idiomatic examples.\n\n"
+)
+
+# Lines containing a code fence; re.split keeps them as separate parts.
+_FENCE_LINE_RE = re.compile(r"^([^\n]*```[^\n]*)$", re.M)
+# Prose lines worth an emoji marker. Alternatives are tried in order, so a
+# line gets the first kind it qualifies for.
+_MARKED_LINE_RE = re.compile(
+    r"^(?:(?P<section>[^\n]*:[^\S\n]*)"
+    r"|(?P<example>[^\n]*Example[^\n]*)"
+    r"|(?P<note>[^\n]*Note:[^\n]*)"
+    r"|(?P<warning>[^\n]*(?i:warning|caution|important)[^\n]*))$",
+    re.M,
+)
+_LINE_MARKERS = {"section": "🔍 ", "example": "💡 ", "note": "📝 ", "warning": "⚠️ "}
+
+
+def _add_line_marker(match: "re.Match[str]") -> str:
+    """Prefix a line matched by _MARKED_LINE_RE with its emoji marker."""
+    group = match.lastgroup
+    assert group is not None  # Every alternative is a named group
+    return _LINE_MARKERS[group] + match.group(0)
+
+
+def _mark_line(line: str, in_code: bool) -> Tuple[str, bool]:
+    """Mark one response line; return it with the updated code-fence state."""
+    if "```" in line:
+        return line, not in_code
+    if in_code:
+        return line, in_code
+    return _MARKED_LINE_RE.sub(_add_line_marker, line), in_code
+
+
+async def _marked_lines(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Regroup streamed text into marked lines, each ending in a newline.
+
+    The code-fence state carries across chunks, so joining the output gives
+    the same text as marking the whole response at once.
+    """
+    in_code = False
+    buffer = ""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line, in_code = _mark_line(line, in_code)
+            yield line + "\n"
+    if buffer:
+        yield _mark_line(buffer, in_code)[0]
+
+
+# Canned material attached to OpenAI answers, by technical domain.
+_DOMAIN_EXAMPLES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "python": (
+            "# Modern Python example\nasync def process_data(items: List[Dict]):\n    results = await asyncio.gather(*[process_item(item) for item in items])\n    return [result for result in results if result]",
+            "# Type hints example\nfrom typing import Optional\n\ndef get_user(user_id: int) -> Optional[Dict]:\n    user = db.query(user_id)\n    return user if user else None",
+        ),
+        "web": (
+            "# FastAPI endpoint example\n@app.get('/api/v1/items/{item_id}')\nasync def get_item(item_id: int) -> Dict:\n    return await items_service.get_item(item_id)",
+            "# Error handling example\nfrom fastapi import HTTPException\n\ndef validate_item(item: Item) -> None:\n    if not item.name:\n        raise HTTPException(status_code=400, detail='Name is required')",
+        ),
+    }
+)
+
+_BASE_DOCS = ("Project Documentation", "README.md")
+_DOMAIN_DOCS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "python": ("Python Best Practices Guide", "Type Hints Documentation"),
+        "web": ("FastAPI Documentation", "API Design Guide"),
+        "github": ("Git Workflow Guide", "GitHub Actions Setup"),
+        "architecture": ("System Architecture Doc", "Design Patterns Guide"),
+    }
+)
+
+_GENERIC_FOLLOWUPS = (
+    "Would you like to see more detailed examples?",
+    "Should I explain any part in more detail?",
+    "Would you like to learn about best practices for this?",
+)
+
+_DOMAIN_FOLLOWUPS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "python": (
+            "How do I implement this with async/await?",
+            "What are the type hints for this case?",
+        ),
+        "web": (
+            "How do I handle errors in this API?",
+            "What about request validation?",
+        ),
+        "testing": ("How do I write tests for this?", "What about edge cases?"),
+        "deployment": (
+            "How do I deploy this to production?",
+            "What about monitoring?",
+        ),
+    }
+)
+
+
+# Keyword tables fused into matchers scanned once per query.
+_TOPIC_MATCHER = KeywordMatcher(
+    (kw, topic)
+    for topic, patterns in _TOPIC_PATTERNS.items()
+    for kw in patterns["primary"] + patterns["secondary"]
+)
+_DOMAIN_MATCHER = KeywordMatcher(
+    (kw, (domain, tier))
+    for domain, tiers in _DOMAIN_PATTERNS.items()
+    for tier, keywords in tiers.items()
+    for kw in keywords
+)
+_OPENAI_TIER_MATCHER = KeywordMatcher(
+    [(kw, "ai") for kw in _AI_KEYWORDS]
+    + [(kw, "complex") for kw in _COMPLEX_PATTERNS]
+    + [(kw, "contextual") for kw in _CONTEXTUAL_KEYWORDS]
+)
+
+_FEATURE_MATCHER = KeywordMatcher(
+    [
+        (kw, flag)
+        for topic, flag in (
+            ("identity", _F_IDENTITY),
+            ("mcp", _F_MCP),
+            ("python", _F_PYTHON),
+        )
+        for tier in ("primary", "secondary")
+        for kw in _TOPIC_PATTERNS[topic][tier]
+    ]
+    + [(kw, _F_ERROR) for kw in _ERROR_QUERY_KEYWORDS]
+    + [(kw, _F_CAPABILITY) for kw in _CAPABILITY_KEYWORDS]
+)
+
+
+# The query classifiers are pure functions of the lowercased query, so
+# repeated queries are answered from small LRU caches.
+@lru_cache(maxsize=256)
+def _find_topics(query_lower: str) -> FrozenSet[str]:
+    """Return the topics mentioned in a lowercased query."""
+    return frozenset(_TOPIC_MATCHER.find(query_lower))
+
+
+@lru_cache(maxsize=256)
+def _query_features(query_lower: str) -> int:
+    """Return the feature flags of a lowercased query, except _F_DOMAIN."""
+    features = 0
+    for flag in _FEATURE_MATCHER.find(query_lower):
+        features |= flag
+    if _GREETING_RE.search(query_lower):
+        features |= _F_GREETING
+    return features
+
+
+@lru_cache(maxsize=256)
+def _score_domain(query_lower: str) -> str:
+    """Return the best scoring technical domain of a lowercased query."""
+    scores = dict.fromkeys(_DOMAIN_PATTERNS, 0.0)
+    # Each matched (domain, tier) pair counts once, whatever the hit count
+    for domain, tier in _DOMAIN_MATCHER.find(query_lower):
+        scores[domain] += _DOMAIN_TIER_WEIGHTS[tier]
+
+    # Get domain with highest score
+    max_score = max(scores.values())
+    if max_score > 0:
+        return max(scores.items(), key=lambda x: x[1])[0]
+
+    return "general"
+
+
+@lru_cache(maxsize=256)
+def _needs_openai(query_lower: str, network_ok: bool) -> bool:
+    """Decide whether a lowercased query should be routed to OpenAI."""
+    tiers = _OPENAI_TIER_MATCHER.find(query_lower)
+
+    # Direct AI keywords take highest priority
+    if "ai" in tiers:
+        return True
+
+    # If network is good, use AI for complex or contextual queries
+    if network_ok:
+        # Complex patterns take second priority
+        if "complex" in tiers:
+            return True
+
+        # Contextual keywords take third priority; only use OpenAI for
+        # longer, more complex queries with these keywords
+        if "contextual" in tiers:
+            return len(query_lower.split()) > 3
+
+    return False
+
+
+# Sampling settings shared by the buffered and streaming completion calls.
+_COMPLETION_OPTIONS: Dict[str, Any] = {
+    "model": "gpt-4",  # Use the most capable model
+    "temperature": 0.7,  # Balance between creativity and accuracy
+    "max_tokens": 1000,  # Adjust based on expected response length
+    "presence_penalty": 0.6,  # Encourage diverse responses
+    "frequency_penalty": 0.2,  # Reduce repetition
+}
+
+
+def _completion_messages(prompt: str) -> List["ChatCompletionMessageParam"]:
+    """Return the chat messages sent to OpenAI for ``prompt``."""
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
 
-@dataclass
+# Shared OpenAI client, created on first use; see _get_openai_client().
+_OPENAI_CLIENT: Optional["AsyncOpenAI"] = None
+_OPENAI_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_openai_client() -> "AsyncOpenAI":
+    """Return the AsyncOpenAI client for the running event loop.
+
+    One client keeps its HTTP connection pool alive between calls, so
+    repeated requests skip the TCP and TLS handshakes. Pooled connections
+    belong to the loop that opened them, and the CLI runs each query under
+    its own asyncio.run(), so a new loop gets a new client. The SDK is
+    imported lazily so local-only use never loads it.
+    """
+    global _OPENAI_CLIENT, _OPENAI_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _OPENAI_CLIENT is None or _OPENAI_CLIENT_LOOP is not loop:
+        import httpx
+        from openai import AsyncOpenAI
+
+        _OPENAI_CLIENT_LOOP = loop
+        _OPENAI_CLIENT = AsyncOpenAI(
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        )
+    return _OPENAI_CLIENT
+
+
+@dataclass(frozen=True, slots=True)
 class Response:
     """Chatbot response with metadata."""
 
@@ -23,44 +677,163 @@ class Response:
     code_examples: Optional[List[str]] = None
 
 
+# Fixed responses; Response is frozen, so one instance serves every caller.
+_GREETING_RESPONSE = Response(
+    text=_GREETING_TEXT,
+    confidence=1.0,
+    context={"type": "greeting"},
+    references=[],
+    followup_questions=[
+        "Tell me about Python features",
+        "How does MCP work?",
+        "Show me the project structure",
+    ],
+)
+
+_IDENTITY_RESPONSE = Response(
+    text=_IDENTITY_TEXT,
+    confidence=1.0,
+    context={"type": "identity"},
+    references=["Project Documentation"],
+    followup_questions=[
+        "Show me Python best practices",
+        "Explain the project structure",
+        "Help with error handling",
+    ],
+)
+
+_CAPABILITY_RESPONSE = Response(
+    text=_CAPABILITY_TEXT,
+    confidence=1.0,
+    context={"type": "capabilities"},
+    references=[],
+    followup_questions=[
+        "Tell me about Python features",
+        "How does MCP work?",
+        "Explain the project structure",
+    ],
+)
+
+_MCP_PYTHON_RESPONSE = Response(
+    text=_MCP_PYTHON_TEXT,
+    confidence=0.95,
+    context={
+        "type": "technical",
+        "domains": ["python", "mcp"],
+        "focus": "implementation",
+    },
+    references=[
+        "src/main.py",
+        "src/chatbot.py",
+        "src/training/",
+        "Project Documentation",
+    ],
+    followup_questions=[
+        "How do type hints work?",
+        "Explain the MCP server architecture",
+        "Show me testing examples",
+    ],
+)
+
+_OFFLINE_RESPONSE = Response(
+    text=_OFFLINE_TEXT,
+    confidence=0.8,
+    context={"type": "network_error", "fallback": "local"},
+    references=[],
+)
+
+_ERROR_HELP_RESPONSE = Response(
+    text=_ERROR_HELP_TEXT,
+    confidence=0.7,
+    context={"type": "error", "stage": "gathering_info"},
+    references=["Troubleshooting Guide"],
+)
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """One tracked interaction in the conversation history."""
+
+    query: str
+    text: str
+    confidence: float
+    category: str
+    references: List[str]
+    followup_questions: Optional[List[str]]
+    code_examples: Optional[List[str]]
+    timestamp: float  # time.time() of the interaction
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Return the interaction time as a local ISO 8601 string."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
+
+class _ResponseCache:
+    """Small LRU cache of responses, optionally expiring after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic time stored, response)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Response]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        """Return the cached response for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Hashable, response: Response) -> None:
+        """Store ``response``, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class DineshAssistant:
     """Personal chatbot assistant for development and project help."""
 
-    def __init__(self):
+    def __init__(self, config: Optional[AppConfig] = None):
         """Initialize the chatbot with advanced capabilities."""
+        self.config = config or AppConfig()
         self.name = "Dinesh Assistant"
         self.topic_manager = TopicManager()
         self._context: Dict[str, Any] = {
-            "conversation_history": [],
+            # Only the last 10 interactions are kept
+            "conversation_history": deque(maxlen=10),
             "error_context": {},
             "domain_context": {},
             "user_preferences": {},
         }
+        self._response_cache = _ResponseCache()
+        # OpenAI answers cost a round trip and tokens; reuse them for a while
+        self._openai_cache = _ResponseCache(ttl=self.config.cache_timeout)
+        # OpenAI response-cache and provider prompt-cache counters
+        self._cache_stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "cached_tokens": 0,
+            "total_prompt_tokens": 0,
+        }
+        # prompt -> OpenAI request in flight; see _call_openai_api
+        self._inflight_openai: Dict[str, "asyncio.Future[str]"] = {}
+        # (monotonic time of last probe, result); see _check_network
+        self._network_status: Tuple[float, bool] = (0.0, False)
         self._initialize_greetings()
         self._initialize_error_handlers()
+        self._initialize_dispatch()
 
     def _initialize_greetings(self) -> None:
         """Initialize enhanced greeting responses."""
-        self.greeting_text = (
-            "Hello! 👋 I'm your AI assistant. Let me help you with:\n\n"
-            "1. 🚀 Technical Implementation\n"
-            "   • Python development and best practices\n"
-            "   • FastAPI and web services\n"
-            "   • Testing and quality assurance\n\n"
-            "2. � Project Features\n"
-            "   • GitHub integration and CI/CD\n"
-            "   • MCP server deployment\n"
-            "   • Hybrid architecture\n\n"
-            "3. 🤖 AI Integration\n"
-            "   • Context management\n"
-            "   • Enhanced responses\n"
-            "   • Intelligent assistance\n\n"
-            "4. �️ Development Support\n"
-            "   • Error troubleshooting\n"
-            "   • Performance optimization\n"
-            "   • Security best practices\n\n"
-            "How can I assist you today? Feel free to ask in your own words! 😊"
-        )
+        self.greeting_text = _GREETING_TEXT
 
     def _initialize_error_handlers(self) -> None:
         """Initialize error handling patterns and responses."""
@@ -86,88 +859,52 @@ class DineshAssistant:
                 "handler": self._handle_value_error,
             },
         }
-
-    def greet(self) -> str:
-        """Generate a greeting message."""
-        return self.greeting_text
-
-    def _extract_topics(self, query: str) -> List[str]:
-        """Extract and prioritize topics from the query."""
-        topics = set()
-
-        topic_patterns = {
-            "python": {
-                "primary": ["python", "code", "programming", "script"],
-                "secondary": ["development", "type hints", "async", "test"],
-                "layman": [
-                    "write a program",
-                    "create something",
-                    "build",
-                    "make",
-                    "fix code",
-                ],
-            },
-            "mcp": {
-                "primary": ["mcp", "model context protocol", "smart server"],
-                "secondary": ["server", "integration", "context", "connect"],
-                "layman": ["ai connection", "smart system", "brain", "intelligence"],
-            },
-            "identity": {
-                "primary": ["powered by", "who are you", "what are you", "your name"],
-                "secondary": ["capabilities", "features", "can you", "help me"],
-                "layman": [
-                    "what can you do",
-                    "how do you work",
-                    "tell me about yourself",
-                ],
-            },
-            "architecture": {
-                "primary": ["architecture", "structure", "design", "system"],
-                "secondary": ["organization", "pattern", "flow", "layout"],
-                "layman": ["how does it work", "explain the system", "show me around"],
-            },
-            "web": {
-                "primary": ["web", "api", "endpoint", "http", "fastapi"],
-                "secondary": ["server", "route", "request", "response"],
-                "layman": ["website", "webpage", "online", "internet", "web service"],
-            },
-            "deployment": {
-                "primary": ["deploy", "install", "setup", "configuration"],
-                "secondary": ["launch", "start", "run", "execute"],
-                "layman": ["get it running", "make it work", "start the system"],
-            },
-            "error": {
-                "primary": ["error", "bug", "issue", "problem", "crash"],
-                "secondary": ["not working", "fails", "wrong", "incorrect"],
-                "layman": [
-                    "broken",
-                    "doesn't work",
-                    "help me fix",
-                    "something's wrong",
-                ],
-            },
-            "documentation": {
-                "primary": ["docs", "documentation", "guide", "tutorial"],
-                "secondary": ["example", "explanation", "reference"],
-                "layman": ["show me how", "teach me", "learn about", "understand"],
-            },
+        # One case-insensitive alternation per error category, searched in
+        # declared order; a single alternation would miss overlapping matches
+        # ("TypeError occurred" hides "Error occurred").
+        self._error_pattern_res = {
+            pattern_type: re.compile(
+                "|".join(re.escape(p) for p in info["patterns"]), re.IGNORECASE
+            )
+            for pattern_type, info in self.error_patterns.items()
         }
 
-        query_lower = query.lower()
+    def _initialize_dispatch(self) -> None:
+        """Map query feature masks to local handlers, in priority order."""
+        self._dispatch_order: Tuple[Tuple[int, Callable[[str, str], Response]], ...] = (
+            # Handle identity questions first
+            (_F_IDENTITY, lambda query, domain: _IDENTITY_RESPONSE),
+            # Handle MCP + Python combination
+            (
+                _F_MCP | _F_PYTHON,
+                lambda query, domain: self._handle_mcp_python_query(query),
+            ),
+            # Check for error-related queries
+            (_F_ERROR, lambda query, domain: self._handle_error_query(query)),
+            # Enhanced greeting detection
+            (_F_GREETING, lambda query, domain: _GREETING_RESPONSE),
+            # Process domain-specific queries
+            (_F_DOMAIN, self._handle_domain_query),
+            # Process capability queries
+            (
+                _F_CAPABILITY,
+                lambda query, domain: self._handle_capability_query(query),
+            ),
+        )
 
-        for topic, patterns in topic_patterns.items():
-            if any(kw in query_lower for kw in patterns["primary"]):
-                topics.add(topic)
-            elif any(kw in query_lower for kw in patterns["secondary"]):
-                topics.add(topic)
+    def greet(self) -> str:
+        """Generate a greeting message."""
+        return _GREETING_TEXT
 
-        return list(topics)
+    def _extract_topics(self, query_lower: str) -> FrozenSet[str]:
+        """Extract the topics mentioned in the lowercased query."""
+        return _find_topics(query_lower)
 
-    async def _handle_error_query(self, query: str) -> Response:
+    def _handle_error_query(self, query: str) -> Response:
         """Handle queries related to errors and issues."""
-        for pattern_type, info in self.error_patterns.items():
-            if any(p in query.lower() for p in info["patterns"]):
-                response_text = info["handler"](query)
+        for pattern_type, pattern_re in self._error_pattern_res.items():
+            if pattern_re.search(query):
+                response_text = self.error_patterns[pattern_type]["handler"](query)
                 return Response(
                     text=response_text,
                     confidence=0.9,
@@ -176,19 +913,9 @@ class DineshAssistant:
                 )
 
         # Generic error handling response
-        return Response(
-            text=(
-                "I'll help you troubleshoot this issue. Could you please:\n"
-                "1. Share the exact error message\n"
-                "2. Describe what you were trying to do\n"
-                "3. Show me the relevant code section"
-            ),
-            confidence=0.7,
-            context={"type": "error", "stage": "gathering_info"},
-            references=["Troubleshooting Guide"],
-        )
+        return _ERROR_HELP_RESPONSE
 
-    async def _handle_domain_query(self, query: str, domain: str) -> Response:
+    def _handle_domain_query(self, query: str, domain: str) -> Response:
         """Handle domain-specific queries."""
         topic_response = self.topic_manager.get_response(query)
         return Response(
@@ -196,183 +923,188 @@ class DineshAssistant:
             confidence=topic_response.confidence,
             context={"type": "domain", "domain": domain},
             references=topic_response.references,
-            followup_questions=getattr(topic_response, "followup_questions", None),
-            code_examples=getattr(topic_response, "code_examples", None),
+            followup_questions=topic_response.followup_questions,
+            code_examples=topic_response.code_examples,
         )
 
-    def _is_capability_query(self, query: str) -> bool:
-        """Check if the query is about the assistant's capabilities."""
-        capability_keywords = [
-            "can you",
-            "what can",
-            "help me",
-            "your capabilities",
-            "what do you do",
-            "how do you",
-            "abilities",
-        ]
-        return any(keyword in query.lower() for keyword in capability_keywords)
-
-    async def _handle_capability_query(self, query: str) -> Response:
+    def _is_capability_query(self, query_lower: str) -> bool:
+        """Check if the lowercased query is about the assistant's capabilities."""
+        return bool(_query_features(query_lower) & _F_CAPABILITY)
+
+    def _handle_capability_query(self, query: str) -> Response:
         """Handle queries about the assistant's capabilities."""
-        return Response(
-            text=(
-                "I can help you with:\n"
-                "1. Python programming questions and issues\n"
-                "2. GitHub-related tasks and queries\n"
-                "3. CI/CD pipeline setup and troubleshooting\n"
-                "4. Model Context Protocol (MCP) implementation\n"
-                "5. General programming assistance and error analysis\n\n"
-                "What would you like to know more about?"
-            ),
-            confidence=1.0,
-            context={"type": "capabilities"},
-            references=[],
-            followup_questions=[
-                "Tell me about Python features",
-                "How does MCP work?",
-                "Explain the project structure",
-            ],
-        )
+        return _CAPABILITY_RESPONSE
 
     async def respond(self, query: str) -> Response:
         """Generate a context-aware response to the user's query."""
         try:
             # Initial query analysis
             query = query.strip()
-            topics = self._extract_topics(query)
-            domain = self._detect_technical_domain(query)
-            needs_ai = self._requires_openai(query)
-            network_ok = self._check_network()
-
-            # Response selection strategy:
-            # 1. If network is good and query needs AI, use OpenAI first
-            # 2. If network is poor or query is simple, use local knowledge
-            # 3. For mixed cases, combine both with confidence scoring
-
-            if needs_ai:
-                if network_ok:
-                    # Try OpenAI first for best response quality
-                    try:
-                        openai_response = await self._get_openai_response(
-                            query, topics, domain
-                        )
-                        if openai_response.confidence > 0.8:
-                            return openai_response
-                    except Exception as e:
-                        # Log error but continue with local knowledge
-                        print(f"OpenAI error: {e}")
-                else:
-                    return Response(
-                        text=(
-                            "I notice your question might benefit from AI-powered analysis, but I'm currently in offline mode. "
-                            "I'll help you with my local knowledge base instead.\n\n"
-                            "For best results with complex queries, please try again when network connectivity is better."
-                        ),
-                        confidence=0.8,
-                        context={"type": "network_error", "fallback": "local"},
-                        references=[],
-                    )
+            query_lower = query.lower()
 
-            query = query.strip()
-            topics = self._extract_topics(query)
+            route, topics, domain = await self._route(query_lower)
 
-            # Handle identity questions first
-            if "identity" in topics:
-                response = Response(
-                    text=(
-                        "I'm your project-specific AI assistant, focused on helping you understand "
-                        "and work with this codebase effectively. I can help with:\n\n"
-                        "1. Python development best practices\n"
-                        "2. Project architecture and components\n"
-                        "3. Error analysis and troubleshooting\n"
-                        "4. Documentation and knowledge sharing\n\n"
-                        "How can I assist you with the project today?"
-                    ),
-                    confidence=1.0,
-                    context={"type": "identity"},
-                    references=["Project Documentation"],
-                    followup_questions=[
-                        "Show me Python best practices",
-                        "Explain the project structure",
-                        "Help with error handling",
-                    ],
-                )
-                self._update_context(query, response)
-                return response
+            if route == "openai":
+                # Try OpenAI first for best response quality
+                try:
+                    openai_response = await self._get_openai_response(
+                        query, topics, domain
+                    )
+                    if openai_response.confidence > 0.8:
+                        # Recorded like respond_stream() records its answers
+                        self._update_context(query, openai_response)
+                        return openai_response
+                except Exception as e:
+                    # Log error but continue with local knowledge
+                    logger.warning("OpenAI error: %s", e)
+                route = "local"
 
-            # Handle MCP + Python combination
-            if set(["mcp", "python"]).issubset(set(topics)):
-                return await self._handle_mcp_python_query(query)
+            return self._routed_response(query, query_lower, route, domain)
 
-            # Check for error-related queries
-            if any(
-                error in query.lower()
-                for error in ["error", "bug", "issue", "problem", "fix"]
-            ):
-                return await self._handle_error_query(query)
+        except Exception as e:
+            return self._error_response(e)
 
-            # Enhanced greeting detection
-            greetings = {
-                "hi",
-                "hello",
-                "hey",
-                "greetings",
-                "good morning",
-                "good afternoon",
-                "good evening",
-                "hi there",
-                "hello there",
-                "howdy",
-            }
-
-            if any(greeting in query.lower() for greeting in greetings):
-                response = Response(
-                    text=self.greeting_text,
-                    confidence=1.0,
-                    context={"type": "greeting"},
-                    references=[],
-                    followup_questions=[
-                        "Tell me about Python features",
-                        "How does MCP work?",
-                        "Show me the project structure",
-                    ],
-                )
-                self._update_context(query, response)
-                return response
+    @staticmethod
+    def _error_response(error: Exception) -> Response:
+        """Apologise for an error raised while answering a query."""
+        return Response(
+            text=(
+                f"I apologize, but I encountered an error: {str(error)}. "
+                "Please try rephrasing your query."
+            ),
+            confidence=0.5,
+            context={"type": "error", "error": str(error)},
+            references=[],
+        )
 
-            # Process domain-specific queries
-            domain = self._detect_technical_domain(query)
-            if domain != "general":
-                return await self._handle_domain_query(query, domain)
+    async def respond_stream(self, query: str) -> AsyncIterator[str]:
+        """Yield the response to ``query`` piece by piece.
 
-            # Process capability queries
-            if self._is_capability_query(query):
-                return await self._handle_capability_query(query)
-
-            # Default to topic manager response
-            topic_response = self.topic_manager.get_response(query)
-            response = Response(
-                text=topic_response.text,
-                confidence=topic_response.confidence,
-                context={"type": "general", "category": topic_response.category},
-                references=topic_response.references,
-                followup_questions=getattr(topic_response, "followup_questions", None),
-                code_examples=getattr(topic_response, "code_examples", None),
-            )
-            self._update_context(query, response)
-            return response
+        Queries answered by OpenAI are streamed line by line as the model
+        produces them. Every other query yields the text from
+        :meth:`respond` in one piece.
+        """
+        query = query.strip()
+        query_lower = query.lower()
+        # Errors become the same apology respond() returns; once streaming
+        # starts the response headers are sent, so nothing may escape.
+        text: Optional[str] = None
+        try:
+            route, topics, domain = await self._route(query_lower)
+            if route != "openai":
+                text = self._routed_response(query, query_lower, route, domain).text
+            else:
+                cache_key = self._openai_cache_key(query, topics, domain)
+                cached = self._openai_cache.get(cache_key)
+                if cached is not None:
+                    self._cache_stats["hits"] += 1
+                    self._update_context(query, cached)
+                    text = cached.text
+                else:
+                    self._cache_stats["misses"] += 1
+                    prompt = self._build_openai_prompt(query, topics, domain)
+        except Exception as e:
+            text = self._error_response(e).text
+        if text is not None:
+            yield text
+            return
 
+        lines: List[str] = []
+        try:
+            async for line in _marked_lines(self._stream_openai(prompt)):
+                lines.append(line)
+                yield line
         except Exception as e:
-            return Response(
-                text=(
-                    f"I apologize, but I encountered an error: {str(e)}. "
-                    "Please try rephrasing your query."
-                ),
-                confidence=0.5,
-                context={"type": "error", "error": str(e)},
-                references=[],
+            logger.warning("OpenAI streaming error: %s", e)
+            if not lines:
+                try:
+                    text = self._routed_response(
+                        query, query_lower, "local", domain
+                    ).text
+                except Exception as local_error:
+                    text = self._error_response(local_error).text
+                yield text
+                return
+            # Part of the answer is already out; record it, but do not cache it
+            self._update_context(
+                query, self._openai_answer(query, "".join(lines), topics, domain)
             )
+            return
+
+        response = self._openai_answer(query, "".join(lines), topics, domain)
+        self._openai_cache.put(cache_key, response)
+        self._update_context(query, response)
+
+    async def _route(self, query_lower: str) -> Tuple[str, FrozenSet[str], str]:
+        """Decide who answers the lowercased query, for respond() and its stream.
+
+        Returns the route ("greeting", "openai", "offline" or "local") with
+        the query's topics and technical domain.
+        """
+        # Bare greetings are the most common query; answer them before
+        # any network probe or classification work.
+        if (
+            query_lower.startswith(_GREETING_STARTS)
+            and query_lower.rstrip(" !.?,") in _GREETINGS
+        ):
+            return "greeting", frozenset(), "general"
+
+        topics = self._extract_topics(query_lower)
+        domain = self._detect_technical_domain(query_lower)
+        network_ok = await self._check_network()
+
+        # Response selection strategy:
+        # 1. If network is good and query needs AI, use OpenAI first
+        # 2. If the query needs AI but the network is down, say so
+        # 3. If network is poor or query is simple, use local knowledge
+        if self._requires_openai(query_lower, network_ok):
+            return ("openai" if network_ok else "offline"), topics, domain
+        return "local", topics, domain
+
+    def _routed_response(
+        self, query: str, query_lower: str, route: str, domain: str
+    ) -> Response:
+        """Answer a query routed anywhere but OpenAI by :meth:`_route`."""
+        if route == "greeting":
+            self._update_context(query, _GREETING_RESPONSE)
+            return _GREETING_RESPONSE
+        if route == "offline":
+            return _OFFLINE_RESPONSE
+
+        # Local answers depend only on the query text, so repeated
+        # queries are served from the cache instead of re-classified.
+        response = self._response_cache.get(query)
+        if response is None:
+            response = self._local_response(query, query_lower, domain)
+            self._response_cache.put(query, response)
+        self._update_context(query, response)
+        return response
+
+    def _local_response(self, query: str, query_lower: str, domain: str) -> Response:
+        """Answer a query from the local knowledge without network access.
+
+        ``domain`` is the technical domain respond() already detected.
+        """
+        features = _query_features(query_lower)
+        if domain != "general":
+            features |= _F_DOMAIN
+
+        # First handler whose required features are all present wins
+        for mask, handler in self._dispatch_order:
+            if features & mask == mask:
+                return handler(query, domain)
+
+        # Default to topic manager response
+        topic_response = self.topic_manager.get_response(query)
+        response = Response(
+            text=topic_response.text,
+            confidence=topic_response.confidence,
+            context={"type": "general", "category": topic_response.category},
+            references=topic_response.references,
+            followup_questions=topic_response.followup_questions,
+            code_examples=topic_response.code_examples,
+        )
+        return response
 
     def _update_context(self, query: str, response: Response) -> None:
         """Update conversation context with enhanced tracking."""
@@ -385,339 +1117,104 @@ class DineshAssistant:
 
         # Track conversation history with enhanced metadata
         self._context["conversation_history"].append(
-            {
-                "query": query,
-                "response": {
-                    "text": response.text,
-                    "confidence": response.confidence,
-                    "category": response.context.get("type", "general"),
-                    "references": response.references,
-                    "followup_questions": getattr(response, "followup_questions", []),
-                    "code_examples": getattr(response, "code_examples", []),
-                },
-                "timestamp": self._get_timestamp(),
-            }
+            HistoryEntry(
+                query=query,
+                text=response.text,
+                confidence=response.confidence,
+                category=response.context.get("type", "general"),
+                references=response.references,
+                followup_questions=response.followup_questions,
+                code_examples=response.code_examples,
+                timestamp=time.time(),
+            )
         )
 
-        # Clean up old history (keep last 10 interactions)
-        if len(self._context["conversation_history"]) > 10:
-            self._context["conversation_history"] = self._context[
-                "conversation_history"
-            ][-10:]
-
     def _handle_runtime_error(self, error: str) -> str:
         """Handle runtime errors with detailed explanation."""
-        return (
-            "🔍 I noticed a runtime error. Let me help you fix that:\n\n"
-            f"Error: {error}\n\n"
-            "Common causes:\n"
-            "1. Invalid operations\n"
-            "2. Resource unavailability\n"
-            "3. State inconsistencies\n\n"
-            "Suggested solutions:\n"
-            "1. Check input validation\n"
-            "2. Verify resource availability\n"
-            "3. Add proper error handling\n\n"
-            "Would you like me to show you an example of proper error handling?"
-        )
+        return _RUNTIME_ERROR_TEMPLATE.format(error=error)
 
     def _handle_import_error(self, error: str) -> str:
         """Handle import errors with installation guidance."""
-        return (
-            "📦 Looks like we have an import issue. Let's resolve it:\n\n"
-            f"Error: {error}\n\n"
-            "This usually means:\n"
-            "1. A package is not installed\n"
-            "2. Python path is incorrect\n"
-            "3. Virtual environment is not activated\n\n"
-            "Quick fix steps:\n"
-            "1. Check requirements.txt\n"
-            "2. Verify virtual environment\n"
-            "3. Install missing packages\n\n"
-            "Would you like me to help you install the required packages?"
-        )
+        return _IMPORT_ERROR_TEMPLATE.format(error=error)
 
     def _handle_syntax_error(self, error: str) -> str:
         """Handle syntax errors with code correction."""
-        return (
-            "🔧 I found a syntax error. Let me help you fix it:\n\n"
-            f"Error: {error}\n\n"
-            "Common issues:\n"
-            "1. Missing parentheses/brackets\n"
-            "2. Incorrect indentation\n"
-            "3. Invalid Python syntax\n\n"
-            "Best practices:\n"
-            "1. Use a code formatter (black)\n"
-            "2. Enable syntax highlighting\n"
-            "3. Check indentation carefully\n\n"
-            "Would you like me to show you the correct syntax?"
-        )
+        return _SYNTAX_ERROR_TEMPLATE.format(error=error)
 
     def _handle_type_error(self, error: str) -> str:
         """Handle type errors with type hints guidance."""
-        return (
-            "📝 I noticed a type error. Let's fix it properly:\n\n"
-            f"Error: {error}\n\n"
-            "This typically means:\n"
-            "1. Incompatible types used\n"
-            "2. Missing type conversions\n"
-            "3. Incorrect method usage\n\n"
-            "Modern Python solutions:\n"
-            "1. Use type hints\n"
-            "2. Add runtime type checking\n"
-            "3. Implement proper validation\n\n"
-            "Would you like to see how to use type hints correctly?"
-        )
+        return _TYPE_ERROR_TEMPLATE.format(error=error)
 
     def _handle_value_error(self, error: str) -> str:
         """Handle value errors with validation guidance."""
-        return (
-            "⚠️ I found a value error. Let's handle it properly:\n\n"
-            f"Error: {error}\n\n"
-            "Common causes:\n"
-            "1. Invalid input values\n"
-            "2. Incorrect data format\n"
-            "3. Missing validation\n\n"
-            "Best practices:\n"
-            "1. Add input validation\n"
-            "2. Use data validation libraries\n"
-            "3. Implement error boundaries\n\n"
-            "Would you like to see examples of proper validation?"
-        )
+        return _VALUE_ERROR_TEMPLATE.format(error=error)
 
-    async def _handle_mcp_python_query(self, query: str) -> Response:
+    def _handle_mcp_python_query(self, query: str) -> Response:
         """Handle combined MCP and Python-related queries."""
-        return Response(
-            text=(
-                "Let me explain how this project leverages both Python and MCP server capabilities:\n\n"
-                "1. Modern Python Development 🐍\n"
-                "   • Type hints for enhanced code safety\n"
-                "   • Async/await for efficient async operations\n"
-                "   • Latest Python 3.8+ features for better performance\n"
-                "   • Comprehensive testing with pytest\n\n"
-                "2. MCP Server Integration 🔄\n"
-                "   • FastAPI-based implementation for high performance\n"
-                "   • Context-aware response handling\n"
-                "   • Efficient state management\n"
-                "   • Domain-specific knowledge integration\n\n"
-                "3. Development Workflow ⚙️\n"
-                "   • Code quality tools: mypy, black, isort\n"
-                "   • Automated testing and CI/CD\n"
-                "   • Clear documentation standards\n"
-                "   • Modular project structure\n\n"
-                "4. Key Features 🎯\n"
-                "   • Intelligent response generation\n"
-                "   • Enhanced context management\n"
-                "   • Multi-domain knowledge support\n"
-                "   • Error handling and recovery\n\n"
-                "Would you like to explore any specific aspect in more detail?"
-            ),
-            confidence=0.95,
-            context={
-                "type": "technical",
-                "domains": ["python", "mcp"],
-                "focus": "implementation",
-            },
-            references=[
-                "src/main.py",
-                "src/chatbot.py",
-                "src/training/",
-                "Project Documentation",
-            ],
-            followup_questions=[
-                "How do type hints work?",
-                "Explain the MCP server architecture",
-                "Show me testing examples",
-            ],
-        )
+        return _MCP_PYTHON_RESPONSE
 
-    def _detect_technical_domain(self, query: str) -> str:
-        """Detect the technical domain of the query with enhanced understanding."""
-        domain_patterns = {
-            "python": {
-                "keywords": ["python", "code", "function", "class", "method"],
-                "phrases": ["write a program", "create a script", "python code"],
-                "concepts": ["object oriented", "inheritance", "variables"],
-                "layman": ["make it work", "write something", "program logic"],
-            },
-            "web": {
-                "keywords": ["api", "endpoint", "http", "fastapi", "route"],
-                "phrases": ["web service", "api endpoint", "http request"],
-                "concepts": ["rest", "http methods", "api design"],
-                "layman": ["website", "web page", "internet", "online"],
-            },
-            "github": {
-                "keywords": ["git", "github", "commit", "push", "pull"],
-                "phrases": ["version control", "source code", "repository"],
-                "concepts": ["branching", "merging", "collaboration"],
-                "layman": ["save changes", "track code", "backup code"],
-            },
-            "ai": {
-                "keywords": ["model", "ml", "train", "predict", "ai"],
-                "phrases": ["machine learning", "artificial intelligence"],
-                "concepts": ["neural network", "deep learning", "training"],
-                "layman": ["smart system", "intelligence", "learning"],
-            },
-            "architecture": {
-                "keywords": ["design", "structure", "pattern", "component"],
-                "phrases": ["system design", "project structure"],
-                "concepts": ["modularity", "scalability", "patterns"],
-                "layman": ["how it works", "system layout", "organization"],
-            },
-            "testing": {
-                "keywords": ["test", "pytest", "coverage", "assert"],
-                "phrases": ["unit test", "integration test"],
-                "concepts": ["test cases", "mocking", "fixtures"],
-                "layman": ["check if it works", "verify", "validate"],
-            },
-            "deployment": {
-                "keywords": ["deploy", "server", "cloud", "container"],
-                "phrases": ["production environment", "deployment process"],
-                "concepts": ["continuous integration", "automation"],
-                "layman": ["put online", "make live", "launch"],
-            },
-        }
-
-        def calculate_domain_score(query_lower: str, patterns: dict) -> float:
-            score = 0
-            # Direct keyword matches have highest weight
-            if any(kw in query_lower for kw in patterns["keywords"]):
-                score += 3
-            # Phrase matches have medium weight
-            if any(phrase in query_lower for phrase in patterns["phrases"]):
-                score += 2
-            # Concept and layman term matches have lower weight
-            if any(concept in query_lower for concept in patterns["concepts"]):
-                score += 1
-            if any(term in query_lower for term in patterns["layman"]):
-                score += 0.5
-            return score
+    def _detect_technical_domain(self, query_lower: str) -> str:
+        """Detect the technical domain of the lowercased query."""
+        return _score_domain(query_lower)
 
-        query_lower = query.lower()
-        scores = {
-            domain: calculate_domain_score(query_lower, patterns)
-            for domain, patterns in domain_patterns.items()
-        }
+    def _requires_openai(self, query_lower: str, network_ok: bool) -> bool:
+        """Check if the lowercased query requires OpenAI and should be prioritized."""
+        return _needs_openai(query_lower, network_ok)
 
-        # Get domain with highest score
-        max_score = max(scores.values())
-        if max_score > 0:
-            return max(scores.items(), key=lambda x: x[1])[0]
-
-        return "general"
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp for context tracking."""
-        from datetime import datetime
-
-        return datetime.now().isoformat()
-
-    def _requires_openai(self, query: str) -> bool:
-        """Check if the query requires OpenAI capabilities and if it should be prioritized."""
-        # Direct AI keywords that strongly suggest OpenAI usage
-        ai_keywords = [
-            "generate",
-            "create",
-            "write",
-            "analyze",
-            "summarize",
-            "explain in detail",
-            "compare",
-            "improve",
-            "suggest",
-            "how would you",
-            "what do you think",
-            "complex",
-            "advanced",
-            "ai",
-            "intelligence",
-        ]
-
-        # Contextual keywords that might benefit from AI
-        contextual_keywords = [
-            "why",
-            "how come",
-            "what if",
-            "explain",
-            "understand",
-            "help me with",
-            "show me how",
-            "can you help",
-            "best way to",
-            "alternative",
-            "better way",
-            "optimize",
-            "improve",
-        ]
-
-        # Complex question indicators
-        complex_patterns = [
-            "difference between",
-            "compare and contrast",
-            "pros and cons",
-            "advantages and disadvantages",
-            "step by step",
-            "in depth",
-            "detailed explanation",
-        ]
-
-        # Check network conditions and query complexity
-        query_lower = query.lower()
-
-        # Direct AI keywords take highest priority
-        if any(keyword in query_lower for keyword in ai_keywords):
-            return True
-
-        # If network is good, use AI for complex or contextual queries
-        if self._check_network():
-            # Complex patterns take second priority
-            if any(pattern in query_lower for pattern in complex_patterns):
-                return True
-
-            # Contextual keywords take third priority
-            if any(keyword in query_lower for keyword in contextual_keywords):
-                # Only use OpenAI for longer, more complex queries with these keywords
-                words = query_lower.split()
-                return (
-                    len(words) > 3
-                )  # Only use OpenAI for more complex contextual queries
-
-        return False
-
-    def _check_network(self) -> bool:
+    async def _check_network(self) -> bool:
         """Check if network connectivity is available and fast enough for AI operations."""
-        import socket
-        import statistics
-        import time
+        checked_at, network_ok = self._network_status
+        if checked_at and time.monotonic() - checked_at < _NETWORK_CHECK_TTL:
+            return network_ok
 
-        def measure_latency() -> float:
+        async def measure_latency() -> float:
+            start = time.monotonic()
             try:
-                start = time.time()
-                socket.create_connection(("api.openai.com", 443), timeout=1)
-                return time.time() - start
-            except (OSError, socket.timeout):
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection("api.openai.com", 443), timeout=1
+                )
+            except (OSError, asyncio.TimeoutError):
                 return float("inf")
+            latency = time.monotonic() - start
+            writer.close()
+            return latency
 
-        # Test multiple times to get a stable measurement
-        latencies = [measure_latency() for _ in range(3)]
+        # Test multiple times to get a stable measurement, concurrently so the
+        # event loop is never blocked on a probe
+        latencies = await asyncio.gather(*(measure_latency() for _ in range(3)))
 
         # Remove infinite values from failed attempts
         valid_latencies = [lat for lat in latencies if lat != float("inf")]
 
         # If all attempts failed, network is down
         if not valid_latencies:
-            return False
+            network_ok = False
+        else:
+            # Median of the (at most three) samples; for one or two it is the mean
+            if len(valid_latencies) == 3:
+                median_latency = (
+                    sum(valid_latencies) - min(valid_latencies) - max(valid_latencies)
+                )
+            else:
+                median_latency = sum(valid_latencies) / len(valid_latencies)
 
-        # Calculate median latency
-        median_latency = statistics.median(valid_latencies)
+            # Consider network good if median latency is under 300ms
+            network_ok = median_latency < 0.3
 
-        # Consider network good if median latency is under 300ms
-        return median_latency < 0.3  # 300ms threshold
+        self._network_status = (time.monotonic(), network_ok)
+        return network_ok
 
     async def _get_openai_response(
-        self, query: str, topics: List[str], domain: str
+        self, query: str, topics: FrozenSet[str], domain: str
     ) -> Response:
         """Get an enhanced response using OpenAI capabilities."""
+        cache_key = self._openai_cache_key(query, topics, domain)
+        cached = self._openai_cache.get(cache_key)
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            return cached
+        self._cache_stats["misses"] += 1
+
         try:
             # Prepare context-aware prompt
             prompt = self._build_openai_prompt(query, topics, domain)
@@ -728,206 +1225,157 @@ class DineshAssistant:
             # Post-process the response
             processed_response = self._process_openai_response(response_text, query)
 
-            # Generate relevant code examples if needed
-            code_examples = (
-                self._generate_code_examples(query, domain)
-                if "code" in topics
-                else None
-            )
-
-            # Find relevant documentation references
-            references = self._find_relevant_docs(query, domain)
-
-            # Generate follow-up questions
-            followups = self._generate_followup_questions(query, response_text)
-
-            return Response(
-                text=processed_response,
-                confidence=0.95,  # OpenAI responses get high confidence
-                context={
-                    "type": "ai_enhanced",
-                    "domain": domain,
-                    "topics": topics,
-                    "source": "openai",
-                },
-                references=references,
-                followup_questions=followups,
-                code_examples=code_examples,
-            )
+            response = self._openai_answer(query, processed_response, topics, domain)
+            self._openai_cache.put(cache_key, response)
+            return response
         except Exception as e:
             # Log error and return None to fallback to local knowledge
-            print(f"OpenAI response generation error: {e}")
+            logger.warning("OpenAI response generation error: %s", e)
             raise
 
-    def _build_openai_prompt(self, query: str, topics: List[str], domain: str) -> str:
-        """Build a context-aware prompt for OpenAI."""
-        # Start with the base context
-        prompt = (
-            "You are a technical assistant helping with a Python project. "
-            "Your responses should be clear, accurate, and helpful.\n\n"
-        )
+    @staticmethod
+    def _openai_cache_key(
+        query: str, topics: FrozenSet[str], domain: str
+    ) -> Tuple[str, str, Tuple[str, ...]]:
+        """Return the OpenAI response-cache key for a query."""
+        return (query.lower(), domain, tuple(sorted(topics)))
 
-        # Add domain-specific context
-        domain_contexts = {
-            "python": "Focus on Python best practices, modern features, and clean code.",
-            "web": "Consider FastAPI, API design, and web service architecture.",
-            "github": "Include Git workflow, collaboration, and version control aspects.",
-            "ai": "Focus on AI/ML implementation and integration details.",
-            "architecture": "Consider system design, patterns, and architectural principles.",
-            "testing": "Emphasize testing practices, coverage, and quality assurance.",
-            "deployment": "Focus on deployment, CI/CD, and operational aspects.",
-        }
+    def _openai_answer(
+        self, query: str, text: str, topics: FrozenSet[str], domain: str
+    ) -> Response:
+        """Wrap processed OpenAI ``text`` with its references and follow-ups."""
+        # Generate relevant code examples if needed
+        code_examples = (
+            self._generate_code_examples(query, domain) if "code" in topics else None
+        )
 
-        if domain in domain_contexts:
-            prompt += f"Context: {domain_contexts[domain]}\n\n"
+        return Response(
+            text=text,
+            confidence=0.95,  # OpenAI responses get high confidence
+            context={
+                "type": "ai_enhanced",
+                "domain": domain,
+                "topics": sorted(topics),
+                "source": "openai",
+            },
+            # Find relevant documentation references
+            references=self._find_relevant_docs(query, domain),
+            # Generate follow-up questions
+            followup_questions=self._generate_followup_questions(query, text, domain),
+            code_examples=code_examples,
+        )
 
+    def _build_openai_prompt(
+        self, query: str, topics: FrozenSet[str], domain: str
+    ) -> str:
+        """Build a context-aware prompt for OpenAI."""
         # Add conversation history context if relevant
+        history = ""
         if self._context.get("conversation_history"):
             last_interaction = self._context["conversation_history"][-1]
-            prompt += f"Previous topic: {last_interaction['response']['category']}\n\n"
-
-        # Add the actual query
-        prompt += f"User question: {query}\n\n"
-
-        # Add specific instructions
-        prompt += (
-            "Provide a detailed, well-structured response. "
-            "Include relevant examples and best practices. "
-            "If discussing code, provide clear, idiomatic examples."
-        )
+            history = f"Previous topic: {last_interaction.category}\n\n"
 
-        return prompt
+        # Per-request details go last, after the cacheable prefix
+        guidance = _DOMAIN_CONTEXTS.get(domain)
+        context = f"Context: {guidance}\n\n" if guidance else ""
+        return f"{_PROMPT_PREFIX}{context}{history}User question: {query}"
 
     async def _call_openai_api(self, prompt: str) -> str:
-        """Call OpenAI API with proper error handling and retries."""
-        import asyncio
-
-        from openai import AsyncOpenAI
-
-        # Create async OpenAI client
-        client = AsyncOpenAI()
-
-        async def try_openai_call(retries: int = 3) -> str:
-            for attempt in range(retries):
-                try:
-                    response = await client.chat.completions.create(
-                        model="gpt-4",  # Use the most capable model
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a technical assistant specialized in Python development.",
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        temperature=0.7,  # Balance between creativity and accuracy
-                        max_tokens=1000,  # Adjust based on expected response length
-                        presence_penalty=0.6,  # Encourage diverse responses
-                        frequency_penalty=0.2,  # Reduce repetition
-                    )
-                    return response.choices[0].message.content
-                except Exception:
-                    if attempt == retries - 1:
-                        raise
-                    await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
-            raise RuntimeError("Failed to get OpenAI response after multiple retries")
-
-        return await try_openai_call()
+        """Call OpenAI API, sharing one request among identical prompts.
+
+        Concurrent callers with the same prompt await the request already in
+        flight instead of each paying for their own round trip and tokens.
+        """
+        pending = self._inflight_openai.get(prompt)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request_completion(prompt))
+            self._inflight_openai[prompt] = pending
+            pending.add_done_callback(lambda _: self._inflight_openai.pop(prompt, None))
+        # Shielded so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(pending)
+
+    async def _request_completion(self, prompt: str) -> str:
+        """Request a chat completion with proper error handling and retries.
+
+        Retries are left to the SDK: it backs off exponentially with jitter,
+        honours Retry-After, and only retries timeouts, rate limits, 5xx and
+        connection errors, so permanent failures such as a bad key fail fast.
+        """
+        client = _get_openai_client().with_options(max_retries=self.config.max_retries)
+        response = await client.chat.completions.create(
+            messages=_completion_messages(prompt), **_COMPLETION_OPTIONS
+        )
+        self._record_usage(response.usage)
+        return response.choices[0].message.content or ""
+
+    def _record_usage(self, usage: Any) -> None:
+        """Add a completion's prompt token counts to the cache statistics."""
+        if usage is None:
+            return
+        self._cache_stats["total_prompt_tokens"] += usage.prompt_tokens or 0
+        # Older SDK models keep unknown fields such as this one as plain dicts
+        details = getattr(usage, "prompt_tokens_details", None)
+        if isinstance(details, dict):
+            cached_tokens = details.get("cached_tokens")
+        else:
+            cached_tokens = getattr(details, "cached_tokens", None)
+        self._cache_stats["cached_tokens"] += cached_tokens or 0
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return response-cache hits/misses and prompt tokens served from cache.
+
+        ``hits``/``misses`` count lookups in the OpenAI response cache;
+        ``cached_tokens`` is the part of ``total_prompt_tokens`` the provider
+        reported as read from its prompt-prefix cache.
+        """
+        return dict(self._cache_stats)
+
+    async def _stream_openai(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the completion for ``prompt`` as OpenAI generates it."""
+        client = _get_openai_client().with_options(max_retries=self.config.max_retries)
+        # The options dict hides stream=True from the SDK's overloads
+        stream = cast(
+            "AsyncStream[ChatCompletionChunk]",
+            await client.chat.completions.create(
+                messages=_completion_messages(prompt),
+                stream=True,
+                **_COMPLETION_OPTIONS,
+            ),
+        )
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
 
     def _process_openai_response(self, response_text: str, original_query: str) -> str:
         """Process and enhance the OpenAI response."""
-        # Clean up and format the response
-        lines = response_text.split("\n")
-        processed_lines = []
-
-        code_block = False
-        for line in lines:
-            # Handle code blocks
-            if "```" in line:
-                code_block = not code_block
-                processed_lines.append(line)
-                continue
-
-            # Add emoji indicators for different content types
-            if not code_block:
-                if line.strip().endswith(":"):
-                    line = "🔍 " + line  # Sections
-                elif "Example" in line:
-                    line = "💡 " + line  # Examples
-                elif "Note:" in line:
-                    line = "📝 " + line  # Notes
-                elif any(
-                    word in line.lower() for word in ["warning", "caution", "important"]
-                ):
-                    line = "⚠️ " + line  # Warnings
-
-            processed_lines.append(line)
-
-        return "\n".join(processed_lines)
+        # Fence lines sit at odd indexes; the text between them alternates
+        # between prose and code, starting with prose.
+        parts = _FENCE_LINE_RE.split(response_text)
+        for i in range(0, len(parts), 4):
+            parts[i] = _MARKED_LINE_RE.sub(_add_line_marker, parts[i])
+        return "".join(parts)
 
     def _generate_code_examples(self, query: str, domain: str) -> List[str]:
         """Generate relevant code examples based on the query and domain."""
-        examples = []
-
-        domain_examples = {
-            "python": [
-                "# Modern Python example\nasync def process_data(items: List[Dict]):\n    results = await asyncio.gather(*[process_item(item) for item in items])\n    return [result for result in results if result]",
-                "# Type hints example\nfrom typing import Optional\n\ndef get_user(user_id: int) -> Optional[Dict]:\n    user = db.query(user_id)\n    return user if user else None",
-            ],
-            "web": [
-                "# FastAPI endpoint example\n@app.get('/api/v1/items/{item_id}')\nasync def get_item(item_id: int) -> Dict:\n    return await items_service.get_item(item_id)",
-                "# Error handling example\nfrom fastapi import HTTPException\n\ndef validate_item(item: Item) -> None:\n    if not item.name:\n        raise HTTPException(status_code=400, detail='Name is required')",
-            ],
-        }
-
-        if domain in domain_examples:
-            examples.extend(domain_examples[domain])
-
-        return examples
+        return list(_DOMAIN_EXAMPLES.get(domain, ()))
 
     def _find_relevant_docs(self, query: str, domain: str) -> List[str]:
         """Find relevant documentation references."""
-        base_docs = ["Project Documentation", "README.md"]
+        return [*_BASE_DOCS, *_DOMAIN_DOCS.get(domain, ())]
 
-        domain_docs = {
-            "python": ["Python Best Practices Guide", "Type Hints Documentation"],
-            "web": ["FastAPI Documentation", "API Design Guide"],
-            "github": ["Git Workflow Guide", "GitHub Actions Setup"],
-            "architecture": ["System Architecture Doc", "Design Patterns Guide"],
-        }
-
-        refs = base_docs.copy()
-        if domain in domain_docs:
-            refs.extend(domain_docs[domain])
-
-        return refs
+    def _generate_followup_questions(
+        self, query: str, response: str, domain: Optional[str] = None
+    ) -> List[str]:
+        """Generate contextual follow-up questions.
 
-    def _generate_followup_questions(self, query: str, response: str) -> List[str]:
-        """Generate contextual follow-up questions."""
-        followups = [
-            "Would you like to see more detailed examples?",
-            "Should I explain any part in more detail?",
-            "Would you like to learn about best practices for this?",
-        ]
+        ``domain`` is the already detected domain of ``query``; it is only
+        detected again when the caller does not pass it.
+        """
+        followups = list(_GENERIC_FOLLOWUPS)
 
         # Add domain-specific follow-ups
-        domain_followups = {
-            "python": [
-                "How do I implement this with async/await?",
-                "What are the type hints for this case?",
-            ],
-            "web": [
-                "How do I handle errors in this API?",
-                "What about request validation?",
-            ],
-            "testing": ["How do I write tests for this?", "What about edge cases?"],
-            "deployment": [
-                "How do I deploy this to production?",
-                "What about monitoring?",
-            ],
-        }
-
-        domain = self._detect_technical_domain(query)
-        if domain in domain_followups:
-            followups.extend(domain_followups[domain])
+        if domain is None:
+            domain = self._detect_technical_domain(query.lower())
+        followups.extend(_DOMAIN_FOLLOWUPS.get(domain, ()))
 
         return followups[:3]  # Return top 3 most relevant
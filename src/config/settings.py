@@ -3,18 +3,54 @@
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
-from typing import Dict, Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
 from src.config.i18n import Language
-from src.config.templates import TemplateManager
+from src.config.templates import TemplateInfo, TemplateManager
 from src.config.validation import LogLevel, ValidationError, validate_config
 
-# Load environment variables from .env file
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # Optional speedup; the stdlib json module is used instead.
+    orjson = None  # type: ignore[assignment]
+
+# Environment variables file, read on first AppConfig construction
 env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from the .env file, once per process."""
+    load_dotenv(dotenv_path=env_path)
+
+
+def _getenv(name: str, default: str) -> str:
+    """Read an environment variable, loading the .env file on first use."""
+    _load_env()
+    return os.getenv(name, default)
+
+
+@lru_cache(maxsize=64)
+def _template_info(name: str) -> TemplateInfo:
+    """Look up template metadata once per template name."""
+    return TemplateManager.get_template_info(name)
+
+
+@lru_cache(maxsize=32)
+def _read_config_data(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file; ``mtime_ns`` makes edits miss the cache."""
+    data: Dict[str, Any]
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(filepath, "r") as f:
+            data = json.load(f)
+    return data
 
 
 @dataclass
@@ -36,8 +72,8 @@ class AppConfig:
     _logger: Optional[logging.Logger] = field(default=None, repr=False)
     
     # OpenAI Configuration
-    openai_api_key: str = field(default_factory=lambda: os.getenv('OPENAI_API_KEY', ''))
-    environment: str = field(default_factory=lambda: os.getenv('ENVIRONMENT', 'development'))
+    openai_api_key: str = field(default_factory=lambda: _getenv('OPENAI_API_KEY', ''))
+    environment: str = field(default_factory=lambda: _getenv('ENVIRONMENT', 'development'))
 
     @property
     def openai_enabled(self) -> bool:
@@ -74,7 +110,7 @@ class AppConfig:
             KeyError: If template style doesn't exist.
         """
         # First check if template exists to match test expectations
-        if not TemplateManager.get_template_info(self.template_style):
+        if not _template_info(self.template_style):
             raise KeyError(f"Template style '{self.template_style}' not found")
 
         type_checks = {
@@ -117,19 +153,19 @@ class AppConfig:
         if not os.path.exists(filepath):
             return cls()
 
-        with open(filepath, "r") as f:
-            data = json.load(f)
-            # Convert language from string to enum if needed
-            if "language" in data and isinstance(data["language"], str):
-                try:
-                    data["language"] = Language(data["language"])
-                except ValueError:
-                    raise ValidationError(
-                        {"language": f"Invalid language value: {data['language']}"}
-                    )
-            config = cls(**data)
-            # validate() is called in post_init
-            return config
+        # Copy the cached dict; the language conversion below edits it
+        data = dict(_read_config_data(filepath, os.stat(filepath).st_mtime_ns))
+        # Convert language from string to enum if needed
+        if "language" in data and isinstance(data["language"], str):
+            try:
+                data["language"] = Language(data["language"])
+            except ValueError:
+                raise ValidationError(
+                    {"language": f"Invalid language value: {data['language']}"}
+                )
+        config = cls(**data)
+        # validate() is called in post_init
+        return config
 
     def to_file(self, filepath: str) -> None:
         """Save configuration to a JSON file.
@@ -137,11 +173,15 @@ class AppConfig:
         Args:
             filepath: Path to save JSON config.
         """
+        data = self.to_dict()
+        # Convert enums to string values for JSON
+        if isinstance(data.get("language"), Language):
+            data["language"] = data["language"].value
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         with open(filepath, "w") as f:
-            data = self.to_dict()
-            # Convert enums to string values for JSON
-            if isinstance(data.get("language"), Language):
-                data["language"] = data["language"].value
             json.dump(data, f, indent=2)
 
     def to_dict(self) -> Dict:
@@ -150,4 +190,10 @@ class AppConfig:
         Returns:
             Dictionary representation of config.
         """
-        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        # Every public field is a flat value, so asdict's recursive deep copy
+        # (which also copied the private logger) is not needed.
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if not f.name.startswith("_")
+        }
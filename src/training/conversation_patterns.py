@@ -3,9 +3,42 @@ Conversation patterns and human-like behavior for Dinesh Assistant.
 """
 
 import random
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Deque, Dict, Mapping, Optional, Tuple, Union
+
+from .keyword_matcher import KeywordMatcher
+
+_FAREWELL_FOLLOW_UPS = (
+    "Is there anything else you'd like to know?",
+    "Feel free to ask if you have more questions!",
+    "Don't hesitate to reach out if you need more help.",
+)
+
+# Only the most recent interactions are kept in a ConversationContext
+_HISTORY_LIMIT = 50
+
+_HELP_PATTERNS = (
+    "help",
+    "how can you help",
+    "what can you help with",
+    "how can you help me",
+    "what can you do",
+    "what do you do",
+    "what can you do for me",
+    "how can ai help me",
+    "what are your features",
+)
+_GREETING_PATTERNS = frozenset({"hi", "hello", "hey", "greetings", "hi there"})
+
+# One scan of the query tells enhance_response which patterns it contains.
+_QUERY_KIND_MATCHER = KeywordMatcher(
+    [(pattern, "help") for pattern in _HELP_PATTERNS]
+    + [(word, "error") for word in ("error", "problem", "issue")]
+    + [(word, "learn") for word in ("learn", "teach", "explain")]
+)
 
 
 class Emotion(Enum):
@@ -33,15 +66,111 @@ class ConversationContext:
     """Maintains context for natural conversation flow."""
 
     user_name: Optional[str] = None
-    conversation_history: List[Dict[str, str]] = None
+    conversation_history: Deque[Dict[str, str]] = field(
+        default_factory=lambda: deque(maxlen=_HISTORY_LIMIT)
+    )
     current_topic: Optional[str] = None
     emotion_state: Emotion = Emotion.NEUTRAL
     interaction_count: int = 0
 
-    def __post_init__(self):
-        self.conversation_history = (
-            [] if self.conversation_history is None else self.conversation_history
-        )
+    def __post_init__(self) -> None:
+        # Keep a passed-in history bounded like the default one
+        if self.conversation_history.maxlen != _HISTORY_LIMIT:
+            self.conversation_history = deque(
+                self.conversation_history, maxlen=_HISTORY_LIMIT
+            )
+
+
+# Phrase tables shared by every ConversationPatternLibrary.
+_GREETINGS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "first_time": (
+            "Hello! I'm Dinesh Assistant, ready to assist with the project.",
+            "Hi there! I'm here to help with project tasks.",
+            "Welcome! I'm your project assistant.",
+        ),
+        "returning": (
+            "Welcome back to the project!",
+            "Good to see you again! What would you like to know?",
+            "Hello again! Ready to discuss the project?",
+        ),
+    }
+)
+
+_ACKNOWLEDGMENTS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "understanding": (
+            "I see what you're trying to do.",
+            "I understand your requirement.",
+            "That's a good question about {topic}.",
+        ),
+        "thinking": (
+            "Let me think about the best way to help you with that.",
+            "I'll find the most relevant information for you.",
+            "Give me a moment to gather the best resources.",
+        ),
+    }
+)
+
+_EMPATHY_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "error_encountered": (
+            "I understand how frustrating these errors can be.",
+            "Don't worry, we'll solve this together.",
+            "That's a tricky issue, but we can fix it.",
+        ),
+        "learning_new": (
+            "Learning new technologies can be challenging, but I'm here to help.",
+            "Take your time. We'll go through this step by step.",
+            "That's a great topic to learn about. Let's explore it together.",
+        ),
+    }
+)
+
+_ENCOURAGEMENT: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "progress": (
+            "You're making good progress!",
+            "That's exactly right!",
+            "You're getting the hang of this!",
+        ),
+        "difficulty": (
+            "Let's break this down into smaller steps.",
+            "We can tackle this one piece at a time.",
+            "Don't worry if it seems complex at first.",
+        ),
+    }
+)
+
+_CLARIFICATION: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "request": (
+            "Could you tell me more about what you're trying to achieve?",
+            "Just to make sure I understand correctly, are you trying to {action}?",
+            "Would you mind providing a bit more context?",
+        ),
+        "confirmation": (
+            "Is that what you were looking for?",
+            "Did that help answer your question?",
+            "Would you like me to explain anything in more detail?",
+        ),
+    }
+)
+
+_TRANSITIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "topic_change": (
+            "Now, regarding your question about {new_topic}...",
+            "Let's move on to your point about {new_topic}.",
+            "Speaking of {new_topic}...",
+        ),
+        "additional_info": (
+            "I can also tell you about {related_topic} if you're interested.",
+            "This relates to {related_topic}, which might be helpful to know.",
+            "You might also want to know about {related_topic}.",
+        ),
+    }
+)
 
 
 class ConversationPatternLibrary:
@@ -52,83 +181,13 @@ class ConversationPatternLibrary:
 
     def _initialize_patterns(self):
         """Initialize conversation patterns."""
-        self.greetings = {
-            "first_time": [
-                "Hello! I'm Dinesh Assistant, ready to assist with the project.",
-                "Hi there! I'm here to help with project tasks.",
-                "Welcome! I'm your project assistant.",
-            ],
-            "returning": [
-                "Welcome back to the project!",
-                "Good to see you again! What would you like to know?",
-                "Hello again! Ready to discuss the project?",
-            ],
-        }
-
-        self.acknowledgments = {
-            "understanding": [
-                "I see what you're trying to do.",
-                "I understand your requirement.",
-                "That's a good question about {topic}.",
-            ],
-            "thinking": [
-                "Let me think about the best way to help you with that.",
-                "I'll find the most relevant information for you.",
-                "Give me a moment to gather the best resources.",
-            ],
-        }
-
-        self.empathy_patterns = {
-            "error_encountered": [
-                "I understand how frustrating these errors can be.",
-                "Don't worry, we'll solve this together.",
-                "That's a tricky issue, but we can fix it.",
-            ],
-            "learning_new": [
-                "Learning new technologies can be challenging, but I'm here to help.",
-                "Take your time. We'll go through this step by step.",
-                "That's a great topic to learn about. Let's explore it together.",
-            ],
-        }
-
-        self.encouragement = {
-            "progress": [
-                "You're making good progress!",
-                "That's exactly right!",
-                "You're getting the hang of this!",
-            ],
-            "difficulty": [
-                "Let's break this down into smaller steps.",
-                "We can tackle this one piece at a time.",
-                "Don't worry if it seems complex at first.",
-            ],
-        }
-
-        self.clarification = {
-            "request": [
-                "Could you tell me more about what you're trying to achieve?",
-                "Just to make sure I understand correctly, are you trying to {action}?",
-                "Would you mind providing a bit more context?",
-            ],
-            "confirmation": [
-                "Is that what you were looking for?",
-                "Did that help answer your question?",
-                "Would you like me to explain anything in more detail?",
-            ],
-        }
-
-        self.transitions = {
-            "topic_change": [
-                "Now, regarding your question about {new_topic}...",
-                "Let's move on to your point about {new_topic}.",
-                "Speaking of {new_topic}...",
-            ],
-            "additional_info": [
-                "I can also tell you about {related_topic} if you're interested.",
-                "This relates to {related_topic}, which might be helpful to know.",
-                "You might also want to know about {related_topic}.",
-            ],
-        }
+        # The pattern tables are shared, read-only module mappings
+        self.greetings = _GREETINGS
+        self.acknowledgments = _ACKNOWLEDGMENTS
+        self.empathy_patterns = _EMPATHY_PATTERNS
+        self.encouragement = _ENCOURAGEMENT
+        self.clarification = _CLARIFICATION
+        self.transitions = _TRANSITIONS
 
 
 class ConversationEnhancer:
@@ -137,6 +196,9 @@ class ConversationEnhancer:
     def __init__(self):
         self.patterns = ConversationPatternLibrary()
         self.context = ConversationContext()
+        # Bound once; enhance_response picks from these on every reply
+        self._error_empathy = self.patterns.empathy_patterns["error_encountered"]
+        self._learning_empathy = self.patterns.empathy_patterns["learning_new"]
 
     def enhance_response(
         self, response: str, query: str, topic: Optional[str] = None
@@ -154,18 +216,8 @@ class ConversationEnhancer:
         """
         # For help queries, return unmodified response
         query_lower = query.lower().strip()
-        help_patterns = {
-            "help",
-            "how can you help",
-            "what can you help with",
-            "how can you help me",
-            "what can you do",
-            "what do you do",
-            "what can you do for me",
-            "how can ai help me",
-            "what are your features",
-        }
-        if any(pattern in query_lower for pattern in help_patterns):
+        kinds = _QUERY_KIND_MATCHER.find(query_lower)
+        if "help" in kinds:
             # Enhance help responses with a friendly introduction
             enhanced = []
             if not response.startswith("I'm your AI-powered project assistant"):
@@ -174,19 +226,18 @@ class ConversationEnhancer:
             return "\n".join(enhanced)
 
         # For greetings, return unmodified response
-        greeting_patterns = {"hi", "hello", "hey", "greetings", "hi there"}
-        if query_lower in greeting_patterns:
+        if query_lower in _GREETING_PATTERNS:
             return response
 
         enhanced = []
 
         # Apply empathy patterns for errors
-        if "error" in query_lower or "problem" in query_lower or "issue" in query_lower:
-            enhanced.append(random.choice(self.patterns.empathy_patterns["error_encountered"]))
+        if "error" in kinds:
+            enhanced.append(random.choice(self._error_empathy))
         
         # Apply learning support patterns
-        if "learn" in query_lower or "teach" in query_lower or "explain" in query_lower:
-            enhanced.append(random.choice(self.patterns.empathy_patterns["learning_new"]))
+        if "learn" in kinds:
+            enhanced.append(random.choice(self._learning_empathy))
         
         # Add contextual acknowledgment
         if len(query.split()) > 3:
@@ -200,33 +251,29 @@ class ConversationEnhancer:
         if topic and topic not in ["general_help", "greeting"]:
             enhanced.append("\nWould you like more specific details about this?")
 
-        # Update context
-        self.context.interaction_count += 1
+        # Update context; callers must not call update_context again for this turn
         self.context.current_topic = topic
-        self.context.conversation_history.append({"query": query, "response": response})
+        self.update_context(query, response)
 
         return "\n".join(enhanced)
 
     def generate_farewell(self) -> str:
         """Generate a contextual farewell message."""
-        base_message = (
+        return (
             f"We've had {self.context.interaction_count} helpful interactions. "
             "I hope I've been able to assist you well!\n\n"
+            f"{random.choice(_FAREWELL_FOLLOW_UPS)}"
         )
-        
-        follow_ups = [
-            "Is there anything else you'd like to know?",
-            "Feel free to ask if you have more questions!",
-            "Don't hesitate to reach out if you need more help.",
-        ]
-        
-        return base_message + random.choice(follow_ups)
 
     def reset_context(self):
         """Reset the conversation context."""
         self.context = ConversationContext()
 
     def update_context(self, query: str, response: str):
-        """Update conversation context with new query-response pair."""
+        """Update conversation context with new query-response pair.
+
+        ``enhance_response`` already records the turn it enhances, so call this
+        only for turns that were not passed through it.
+        """
         self.context.interaction_count += 1
         self.context.conversation_history.append({"query": query, "response": response})
@@ -1,11 +1,20 @@
 """Enhanced domain handling for better response management."""
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+import heapq
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from .domains import Domain
+from .keyword_matcher import KeywordMatcher
 
+_WORD_RE = re.compile(r"\w+")
 
-@dataclass
+
+@dataclass(slots=True)
 class DomainInfo:
     """Information about a specific domain."""
     domain: Domain
@@ -15,19 +24,143 @@ class DomainInfo:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DomainResponse:
-    """Structured response for a domain."""
+    """Structured response for a domain; instances are shared, so immutable."""
     text: str
-    references: List[str]
-    followup_questions: List[str]
-    code_examples: Optional[List[str]] = None
+    references: Tuple[str, ...]
+    followup_questions: Tuple[str, ...]
+    code_examples: Optional[Tuple[str, ...]] = None
+    # ``text`` without its intro paragraph; used when combining responses
+    body: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "body", self.text.partition("\n\n")[2])
+
+
+# Responses are immutable, so every call shares these instances.
+_RESPONSES: Dict[Domain, DomainResponse] = {
+    Domain.PYTHON: DomainResponse(
+        text=(
+            "This project uses Python with modern best practices:\n\n"
+            "1. Language Features 🐍\n"
+            "   • Type hints for code safety\n"
+            "   • Async/await for performance\n"
+            "   • Modern Python 3.8+ features\n\n"
+            "2. Development Tools ⚙️\n"
+            "   • pytest for testing\n"
+            "   • mypy for type checking\n"
+            "   • black & isort for formatting\n\n"
+            "3. Project Structure 📁\n"
+            "   • Modular package organization\n"
+            "   • Clean code practices\n"
+            "   • Documentation standards\n\n"
+            "What specific Python feature would you like to explore?"
+        ),
+        references=(
+            "src/main.py",
+            "src/chatbot.py",
+            "src/training/"
+        ),
+        followup_questions=(
+            "How do you use type hints?",
+            "Can you show me async examples?",
+            "How is testing implemented?"
+        ),
+        code_examples=(
+            "# Type hints example\ndef process_data(items: List[str]) -> Dict[str, int]:\n    return {item: len(item) for item in items}",
+            "# Async example\nasync def fetch_data(url: str) -> str:\n    async with aiohttp.ClientSession() as session:\n        async with session.get(url) as response:\n            return await response.text()"
+        ),
+    ),
+    Domain.MCP: DomainResponse(
+        text=(
+            "The MCP (Model Context Protocol) server in this project:\n\n"
+            "1. Key Features 🎯\n"
+            "   • Context-aware response handling\n"
+            "   • Efficient state management\n"
+            "   • Domain-specific integrations\n\n"
+            "2. Implementation ⚙️\n"
+            "   • FastAPI-based architecture\n"
+            "   • Async request processing\n"
+            "   • Structured response format\n\n"
+            "3. Capabilities 💡\n"
+            "   • Multi-domain knowledge\n"
+            "   • Enhanced context tracking\n"
+            "   • Natural language processing\n\n"
+            "What aspect of MCP would you like to learn more about?"
+        ),
+        references=(
+            "src/chatbot.py",
+            "src/training/llm_knowledge_base.py",
+            "docs/HYBRID_ARCHITECTURE.md"
+        ),
+        followup_questions=(
+            "How does context tracking work?",
+            "Can you explain the response format?",
+            "How is state managed?"
+        ),
+    ),
+}
+_DEFAULT_RESPONSE = DomainResponse(
+    text=(
+        "I can help you with:\n\n"
+        "1. Project Features 🚀\n"
+        "   • Python development\n"
+        "   • MCP server integration\n"
+        "   • Project architecture\n\n"
+        "2. Development Support ⚙️\n"
+        "   • Code examples\n"
+        "   • Best practices\n"
+        "   • Troubleshooting\n\n"
+        "What would you like to explore?"
+    ),
+    references=("README.md", "docs/"),
+    followup_questions=(
+        "Tell me about Python features",
+        "How does MCP work?",
+        "Show me the project structure"
+    ),
+)
+
+
+# Response per domain indexed by the Domain value itself; slot 0 is unused.
+_RESPONSE_TABLE: Tuple[DomainResponse, ...] = tuple(
+    _RESPONSES.get(Domain(value), _DEFAULT_RESPONSE) if value else _DEFAULT_RESPONSE
+    for value in range(len(Domain) + 1)
+)
+
+_by_score = itemgetter(1)
+
+_COMBINED_INTRO = "Let me explain how these aspects work together:\n\n"
+_COMBINED_CONNECTOR = "\n\nThis integrates with:\n\n"
+_COMBINED_OUTRO = "\n\nWould you like to explore any specific aspect in more detail?"
+
+
+@lru_cache(maxsize=64)
+def _combined_response(first: Domain, second: Domain) -> DomainResponse:
+    """Combine the responses of the two most relevant domains."""
+    responses = [_RESPONSE_TABLE[domain] for domain in (first, second)]
+
+    return DomainResponse(
+        text=(
+            f"{_COMBINED_INTRO}{responses[0].body}"
+            f"{_COMBINED_CONNECTOR}{responses[1].body}{_COMBINED_OUTRO}"
+        ),
+        # De-duplicated in first-seen order, so the listing is deterministic
+        references=tuple(
+            dict.fromkeys(chain.from_iterable(r.references for r in responses))
+        ),
+        followup_questions=tuple(
+            chain.from_iterable(r.followup_questions[:2] for r in responses)
+        ),
+        code_examples=(),
+    )
 
 
 class DomainHandler:
     """Handler for domain-specific responses and interactions."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize domain handler with predefined domain information."""
         self.domain_info: Dict[Domain, DomainInfo] = {
             Domain.PYTHON: DomainInfo(
@@ -53,6 +186,54 @@ class DomainHandler:
             ),
             # Add other domains as needed
         }
+        # Every known word or phrase gets one bit, so a query's vocabulary
+        # is an int
+        # Interned, and the matcher below reports these same objects, so the
+        # per-word dict lookups in _score_domains compare by identity.
+        vocabulary = sorted(
+            {
+                sys.intern(word)
+                for info in self.domain_info.values()
+                for word in info.keywords | info.context_words
+            }
+        )
+        self._word_to_bit: Dict[str, int] = {
+            word: 1 << index for index, word in enumerate(vocabulary)
+        }
+        # Flat scoring table built once: (domain, keyword mask, context word
+        # mask, priority bonus)
+        self._domain_masks: List[Tuple[Domain, int, int, float]] = [
+            (
+                domain,
+                self._mask(info.keywords),
+                self._mask(info.context_words),
+                info.priority * 0.25,
+            )
+            for domain, info in self.domain_info.items()
+        ]
+        # Inverted index: word -> bitmask of the table rows using it. Rows with
+        # a priority bonus score above zero for any query and are always kept.
+        self._word_domains: Dict[str, int] = {}
+        self._bonus_rows = 0
+        for row, (_, keyword_mask, context_mask, bonus) in enumerate(
+            self._domain_masks
+        ):
+            row_bit = 1 << row
+            for word, bit in self._word_to_bit.items():
+                if bit & (keyword_mask | context_mask):
+                    self._word_domains[word] = self._word_domains.get(word, 0) | row_bit
+            if bonus > 0:
+                self._bonus_rows |= row_bit
+        # One scan finds every known word or phrase in a query. Both sides are
+        # padded with spaces so matches stay on whole words: "how" must not
+        # match inside "show", but "type hints" may span two tokens.
+        self._vocabulary_matcher = KeywordMatcher(
+            (f" {word} ", word) for word in vocabulary
+        )
+        # Per-instance memo of scores by lowercased query
+        self._detect_cached = lru_cache(maxsize=2048)(self._score_domains)
+        # Per-instance memo of whole answers, for queries that recur verbatim
+        self._answer_cached = lru_cache(maxsize=512)(self._answer)
 
     def detect_domains(self, query: str) -> List[Tuple[Domain, float]]:
         """
@@ -64,27 +245,122 @@ class DomainHandler:
         Returns:
             List of (domain, confidence) tuples, sorted by confidence
         """
-        query_words = set(query.lower().split())
+        return sorted(self._detect_cached(query.lower()), key=_by_score, reverse=True)
+
+    def detect_top(self, query: str, k: int = 2) -> List[Tuple[Domain, float]]:
+        """
+        Detect the ``k`` most relevant domains for a query.
+
+        Args:
+            query: User's input query
+            k: Number of domains to return
+
+        Returns:
+            The first ``k`` entries of :meth:`detect_domains`, without
+            ordering the rest
+        """
+        scores = self._detect_cached(query.lower())
+        if k != 2:
+            return heapq.nlargest(k, scores, key=_by_score)
+
+        # One pass for the common case; ties keep the earlier domain first
+        best = second = None
+        for entry in scores:
+            if best is None or entry[1] > best[1]:
+                best, second = entry, best
+            elif second is None or entry[1] > second[1]:
+                second = entry
+        return [entry for entry in (best, second) if entry is not None]
+
+    def answer(self, query: str) -> DomainResponse:
+        """
+        Get the response for a query's most relevant domains.
+
+        Args:
+            query: User's input query
+
+        Returns:
+            The combined response for the top two domains, the response of the
+            only matching domain, or the project response if none match
+        """
+        return self._answer_cached(query.lower())
+
+    def answer_cache_info(self) -> Dict[str, int]:
+        """Return hit/miss statistics of the :meth:`answer` cache.
+
+        ``hits``/``misses`` count :meth:`answer` lookups; ``currsize`` is the
+        number of queries currently cached.
+        """
+        info = self._answer_cached.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "currsize": info.currsize}
+
+    def _answer(self, query_lower: str) -> DomainResponse:
+        """Compose detection and response lookup for a lowercased query."""
+        ranked = self.detect_top(query_lower, 2)
+        if len(ranked) > 1:
+            return self.get_combined_response(ranked)
+        return self.get_domain_response(ranked[0][0] if ranked else Domain.PROJECT)
+
+    def detect_domains_batch(
+        self, queries: Iterable[str]
+    ) -> List[List[Tuple[Domain, float]]]:
+        """
+        Detect relevant domains for many queries at once.
+
+        Args:
+            queries: User input queries
+
+        Returns:
+            One list of (domain, confidence) tuples per query, in input order,
+            each sorted by confidence as in :meth:`detect_domains`
+        """
+        # Repeated queries in a batch are scored once
+        scored: Dict[str, Tuple[Tuple[Domain, float], ...]] = {}
+        results = []
+        for query in queries:
+            query_lower = query.lower()
+            scores = scored.get(query_lower)
+            if scores is None:
+                scores = scored[query_lower] = self._detect_cached(query_lower)
+            results.append(sorted(scores, key=_by_score, reverse=True))
+        return results
+
+    def _mask(self, words: Iterable[str]) -> int:
+        """Return the bitmask of the known words among ``words``."""
+        mask = 0
+        for word in words:
+            mask |= self._word_to_bit.get(word, 0)
+        return mask
+
+    def _score_domains(self, query_lower: str) -> Tuple[Tuple[Domain, float], ...]:
+        """Score every domain against a lowercased query, in table order."""
+        # Words are runs of letters/digits, so "mcp-server" reads as two words
+        padded = f" {' '.join(_WORD_RE.findall(query_lower))} "
+        query_mask = 0
+        rows = self._bonus_rows
+        for word in self._vocabulary_matcher.find(padded):
+            query_mask |= self._word_to_bit[word]
+            rows |= self._word_domains[word]
+
+        # Only rows reached from a query word (or carrying a bonus) can score;
+        # walk their bits lowest first to keep the table order.
         scores: List[Tuple[Domain, float]] = []
-        
-        for domain, info in self.domain_info.items():
-            score = 0.0
-            
-            # Check direct keyword matches (high weight)
-            keyword_matches = len(query_words.intersection(info.keywords))
-            score += keyword_matches * 2.0
-            
-            # Check context word matches (lower weight)
-            context_matches = len(query_words.intersection(info.context_words))
-            score += context_matches * 0.5
-            
-            # Add priority bonus
-            score += info.priority * 0.25
-            
+        while rows:
+            lowest = rows & -rows
+            rows ^= lowest
+            domain, keyword_mask, context_mask, bonus = self._domain_masks[
+                lowest.bit_length() - 1
+            ]
+            # Direct keyword matches weigh more than context word matches
+            score = (
+                (query_mask & keyword_mask).bit_count() * 2.0
+                + (query_mask & context_mask).bit_count() * 0.5
+                + bonus
+            )
             if score > 0:
                 scores.append((domain, score))
-        
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+
+        return tuple(scores)
 
     def get_domain_response(
         self, domain: Domain, context: Optional[str] = None
@@ -94,94 +370,13 @@ class DomainHandler:
         
         Args:
             domain: Domain enum value
-            context: Optional context to customize response
+            context: Optional context to customize response (currently unused;
+                responses depend on the domain only)
             
         Returns:
             DomainResponse with text and metadata
         """
-        if domain == Domain.PYTHON:
-            return DomainResponse(
-                text=(
-                    "This project uses Python with modern best practices:\n\n"
-                    "1. Language Features 🐍\n"
-                    "   • Type hints for code safety\n"
-                    "   • Async/await for performance\n"
-                    "   • Modern Python 3.8+ features\n\n"
-                    "2. Development Tools ⚙️\n"
-                    "   • pytest for testing\n"
-                    "   • mypy for type checking\n"
-                    "   • black & isort for formatting\n\n"
-                    "3. Project Structure 📁\n"
-                    "   • Modular package organization\n"
-                    "   • Clean code practices\n"
-                    "   • Documentation standards\n\n"
-                    "What specific Python feature would you like to explore?"
-                ),
-                references=[
-                    "src/main.py",
-                    "src/chatbot.py",
-                    "src/training/"
-                ],
-                followup_questions=[
-                    "How do you use type hints?",
-                    "Can you show me async examples?",
-                    "How is testing implemented?"
-                ],
-                code_examples=[
-                    "# Type hints example\ndef process_data(items: List[str]) -> Dict[str, int]:\n    return {item: len(item) for item in items}",
-                    "# Async example\nasync def fetch_data(url: str) -> str:\n    async with aiohttp.ClientSession() as session:\n        async with session.get(url) as response:\n            return await response.text()"
-                ]
-            )
-        elif domain == Domain.MCP:
-            return DomainResponse(
-                text=(
-                    "The MCP (Model Context Protocol) server in this project:\n\n"
-                    "1. Key Features 🎯\n"
-                    "   • Context-aware response handling\n"
-                    "   • Efficient state management\n"
-                    "   • Domain-specific integrations\n\n"
-                    "2. Implementation ⚙️\n"
-                    "   • FastAPI-based architecture\n"
-                    "   • Async request processing\n"
-                    "   • Structured response format\n\n"
-                    "3. Capabilities 💡\n"
-                    "   • Multi-domain knowledge\n"
-                    "   • Enhanced context tracking\n"
-                    "   • Natural language processing\n\n"
-                    "What aspect of MCP would you like to learn more about?"
-                ),
-                references=[
-                    "src/chatbot.py",
-                    "src/training/llm_knowledge_base.py",
-                    "docs/HYBRID_ARCHITECTURE.md"
-                ],
-                followup_questions=[
-                    "How does context tracking work?",
-                    "Can you explain the response format?",
-                    "How is state managed?"
-                ]
-            )
-        else:
-            return DomainResponse(
-                text=(
-                    "I can help you with:\n\n"
-                    "1. Project Features 🚀\n"
-                    "   • Python development\n"
-                    "   • MCP server integration\n"
-                    "   • Project architecture\n\n"
-                    "2. Development Support ⚙️\n"
-                    "   • Code examples\n"
-                    "   • Best practices\n"
-                    "   • Troubleshooting\n\n"
-                    "What would you like to explore?"
-                ),
-                references=["README.md", "docs/"],
-                followup_questions=[
-                    "Tell me about Python features",
-                    "How does MCP work?",
-                    "Show me the project structure"
-                ]
-            )
+        return _RESPONSE_TABLE[domain]
 
     def get_combined_response(
         self, domains: List[Tuple[Domain, float]]
@@ -201,28 +396,5 @@ class DomainHandler:
         if len(domains) == 1:
             return self.get_domain_response(domains[0][0])
             
-        # For multiple domains, combine responses intelligently
-        main_responses = []
-        all_references = []
-        all_followups = []
-        
-        for domain, confidence in domains[:2]:  # Take top 2 domains
-            response = self.get_domain_response(domain)
-            main_responses.append(response.text.split("\n\n", 1)[1])  # Skip intro
-            all_references.extend(response.references)
-            all_followups.extend(response.followup_questions[:2])
-                
-        combined_text = (
-            "Let me explain how these aspects work together:\n\n"
-            f"{main_responses[0]}\n\n"
-            "This integrates with:\n\n"
-            f"{main_responses[1]}\n\n"
-            "Would you like to explore any specific aspect in more detail?"
-        )
-        
-        return DomainResponse(
-            text=combined_text,
-            references=list(set(all_references)),
-            followup_questions=all_followups,
-            code_examples=[]
-        )
\ No newline at end of file
+        # Combined responses depend only on the top two domains, in order
+        return _combined_response(domains[0][0], domains[1][0])
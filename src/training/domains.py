@@ -1,10 +1,14 @@
 """Domain definitions for the chatbot knowledge base."""
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class Domain(Enum):
-    """Knowledge domains for the chatbot."""
+class Domain(IntEnum):
+    """Knowledge domains for the chatbot.
+
+    Members are small ints (1..N), so per-domain tables can be indexed by
+    the member directly.
+    """
 
     ARCHITECTURE = auto()  # Project architecture and design
     PYTHON = auto()  # Python-specific features and implementations
@@ -1,15 +1,16 @@
 """Enhanced response patterns for more natural and context-aware responses."""
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
+
+@dataclass(frozen=True, slots=True)
 class ResponsePattern:
-    """Pattern for generating responses."""
+    """Pattern for generating responses; shared between libraries, so immutable."""
 
-    def __init__(self, template: str, variables: List[str], context_required: bool = False):
-        """Initialize response pattern."""
-        self.template = template
-        self.variables = variables
-        self.context_required = context_required
+    template: str
+    variables: Tuple[str, ...]
+    context_required: bool = False
 
     def requires_context(self) -> bool:
         """Check if pattern requires conversation context."""
@@ -29,7 +30,7 @@ class ResponsePatterns:
                 "3. Testing & Deployment 🚀\n"
                 "4. System Operations 🔧\n\n"
                 "What would you like to know more about?",
-                [],
+                (),
                 False
             ),
             ResponsePattern(
@@ -40,7 +41,7 @@ class ResponsePatterns:
                 "• Implementation details\n"
                 "• And much more!\n\n"
                 "How can I help you today?",
-                [],
+                (),
                 False
             )
         ]
@@ -53,14 +54,14 @@ class ResponsePatterns:
                 "Let me tell you about {topic}:\n\n"
                 "{description}\n\n"
                 "Would you like to know more about any specific aspect?",
-                ["topic", "description"],
+                ("topic", "description"),
                 False
             ),
             ResponsePattern(
                 "Here's an overview of {topic}:\n\n"
                 "{description}\n\n"
                 "I can provide more details about any of these points. What interests you?",
-                ["topic", "description"],
+                ("topic", "description"),
                 False
             )
         ]
@@ -74,7 +75,7 @@ class ResponsePatterns:
                 "```{language}\n{code}\n```\n\n"
                 "Explanation:\n{explanation}\n\n"
                 "Would you like me to clarify any part of this?",
-                ["action", "language", "code", "explanation"],
+                ("action", "language", "code", "explanation"),
                 False
             ),
             ResponsePattern(
@@ -82,7 +83,7 @@ class ResponsePatterns:
                 "```{language}\n{code}\n```\n\n"
                 "Here's what's happening:\n{explanation}\n\n"
                 "Let me know if you need any clarification!",
-                ["action", "language", "code", "explanation"],
+                ("action", "language", "code", "explanation"),
                 False
             )
         ]
@@ -98,7 +99,7 @@ class ResponsePatterns:
                 "3. If that doesn't work: {alternative}\n\n"
                 "Additional context:\n{explanation}\n\n"
                 "Would you like me to explain any of these steps in more detail?",
-                ["issue", "check", "solution", "alternative", "explanation"],
+                ("issue", "check", "solution", "alternative", "explanation"),
                 False
             ),
             ResponsePattern(
@@ -108,7 +109,7 @@ class ResponsePatterns:
                 "3. {alternative}\n\n"
                 "Explanation:\n{explanation}\n\n"
                 "Let me know if you need help with any of these steps!",
-                ["issue", "check", "solution", "alternative", "explanation"],
+                ("issue", "check", "solution", "alternative", "explanation"),
                 False
             )
         ]
@@ -124,7 +125,7 @@ class ResponsePatterns:
                 "3. {step3}\n\n"
                 "Additional Information:\n{additional_info}\n\n"
                 "Would you like me to explain any of these steps in more detail?",
-                ["topic", "step1", "step2", "step3", "additional_info"],
+                ("topic", "step1", "step2", "step3", "additional_info"),
                 False
             ),
             ResponsePattern(
@@ -134,7 +135,7 @@ class ResponsePatterns:
                 "Step 3: {step3}\n\n"
                 "Note:\n{additional_info}\n\n"
                 "Which step would you like me to elaborate on?",
-                ["topic", "step1", "step2", "step3", "additional_info"],
+                ("topic", "step1", "step2", "step3", "additional_info"),
                 False
             )
         ]
@@ -147,30 +148,39 @@ class ResponsePatterns:
                 "Building on our discussion about {previous_topic}, here's information about {new_topic}:\n\n"
                 "{content}\n\n"
                 "Would you like me to explain how this relates to {previous_topic}?",
-                ["previous_topic", "new_topic", "content"],
+                ("previous_topic", "new_topic", "content"),
                 True
             ),
             ResponsePattern(
                 "Since we were talking about {previous_topic}, let me show you how {new_topic} connects:\n\n"
                 "{content}\n\n"
                 "I can explain more about either topic. What interests you?",
-                ["previous_topic", "new_topic", "content"],
+                ("previous_topic", "new_topic", "content"),
                 True
             )
         ]
 
+
+# Built once at import; every ResponseLibrary starts from these.
+_DEFAULT_PATTERNS: Dict[str, Tuple[ResponsePattern, ...]] = {
+    "greeting": tuple(ResponsePatterns.get_greeting_patterns()),
+    "project_info": tuple(ResponsePatterns.get_project_info_patterns()),
+    "code_example": tuple(ResponsePatterns.get_code_example_patterns()),
+    "error_handling": tuple(ResponsePatterns.get_error_handling_patterns()),
+    "tutorial": tuple(ResponsePatterns.get_tutorial_patterns()),
+    "context_aware": tuple(ResponsePatterns.get_context_aware_patterns()),
+}
+
+
 class ResponseLibrary:
     """Library of response patterns."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize response library."""
+        # Fresh lists over the shared patterns, so add_patterns stays local
         self._patterns: Dict[str, List[ResponsePattern]] = {
-            "greeting": ResponsePatterns.get_greeting_patterns(),
-            "project_info": ResponsePatterns.get_project_info_patterns(),
-            "code_example": ResponsePatterns.get_code_example_patterns(),
-            "error_handling": ResponsePatterns.get_error_handling_patterns(),
-            "tutorial": ResponsePatterns.get_tutorial_patterns(),
-            "context_aware": ResponsePatterns.get_context_aware_patterns()
+            category: list(patterns)
+            for category, patterns in _DEFAULT_PATTERNS.items()
         }
 
     def get_patterns(self, category: str) -> Optional[List[ResponsePattern]]:
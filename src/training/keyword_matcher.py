@@ -0,0 +1,115 @@
+"""Multi-keyword substring matching for fast query classification."""
+
+import re
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup; the fused regex is used instead.
+    ahocorasick = None
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Render keywords as a regex with shared prefixes factored out.
+
+    Siblings in the trie start with distinct characters, so at most one
+    branch can continue at each step and the greedy optional suffixes make
+    the pattern match the longest keyword at a position without any
+    backtracking across alternatives.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End-of-keyword marker
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+V = TypeVar("V", bound=Hashable)
+
+
+class KeywordMatcher(Generic[V]):
+    """Find every keyword contained in a text in a single linear scan.
+
+    ``find(text)`` returns the same values as checking ``keyword in text`` for
+    each registered keyword. When ``pyahocorasick`` is installed the keywords
+    are compiled into an Aho-Corasick automaton; otherwise they are fused into
+    one trie-shaped regex so the scan still runs inside the ``re`` engine.
+    """
+
+    def __init__(
+        self, entries: Iterable[Tuple[str, V]], use_automaton: bool = True
+    ) -> None:
+        """Build the matcher from ``(keyword, value)`` pairs.
+
+        Args:
+            entries: Keywords and the value each one reports. A keyword may be
+                listed several times to report several values.
+            use_automaton: Use Aho-Corasick when ``pyahocorasick`` is available.
+        """
+        values: Dict[str, Set[V]] = {}
+        for keyword, value in entries:
+            values.setdefault(keyword, set()).add(value)
+
+        self._automaton: Any = None
+        self._pattern: Optional[Pattern[str]] = None
+        self._values: Dict[str, FrozenSet[V]] = {}
+        if not values:
+            return
+
+        if use_automaton and ahocorasick is not None:
+            # The automaton reports every occurrence, overlapping or not.
+            self._automaton = ahocorasick.Automaton()
+            for keyword, vals in values.items():
+                self._automaton.add_word(keyword, frozenset(vals))
+            self._automaton.make_automaton()
+            return
+
+        # The scan reports the longest keyword starting at each position, so
+        # every keyword also carries the values of the keywords prefixing it.
+        self._values = {
+            keyword: frozenset().union(
+                *(vals for other, vals in values.items() if keyword.startswith(other))
+            )
+            for keyword in values
+        }
+        # Zero-width lookahead so overlapping keywords are all visited.
+        self._pattern = re.compile(f"(?=({_trie_pattern(values)}))")
+
+    def find(self, text: str) -> Set[V]:
+        """Return the values of all keywords occurring in ``text``."""
+        found: Set[V] = set()
+        if self._automaton is not None:
+            for _, vals in self._automaton.iter(text):
+                found |= vals
+            return found
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text):
+            found |= self._values[match.group(1)]
+        return found
@@ -3,9 +3,17 @@ Knowledge Base for Dinesh Assistant.
 Defines specialized domain knowledge and response patterns.
 """
 
-from dataclasses import dataclass
+import logging
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Words are runs of letters/digits, so "ci/cd" reads as two words
+_WORD_RE = re.compile(r"\w+")
 
 
 class Domain(Enum):
@@ -16,17 +24,483 @@ class Domain(Enum):
     WEB = "web"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KnowledgeItem:
-    """Represents a piece of knowledge with context and examples."""
+    """Represents a piece of knowledge; items are shared, so immutable."""
 
     domain: Domain
     topic: str
     description: str
-    examples: List[str]
-    related_topics: List[str]
-    common_issues: List[str]
-    solutions: List[str]
+    examples: Tuple[str, ...]
+    related_topics: Tuple[str, ...]
+    common_issues: Tuple[str, ...]
+    solutions: Tuple[str, ...]
+    # Lowercased topic, description, examples and related topics for search;
+    # entries are joined with newlines, which searched phrases never contain
+    search_fields: Tuple[str, str, str, str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "search_fields",
+            (
+                self.topic.lower(),
+                self.description.lower(),
+                "\n".join(self.examples).lower(),
+                "\n".join(self.related_topics).lower(),
+            ),
+        )
+
+
+def _stem(word: str) -> str:
+    """Reduce a plural word to its singular, so "decorators" matches
+    "decorator" and "repositories" matches "repository".
+
+    Indexed words, query words and domain keywords all go through this, so
+    matching stays whole-word on both sides.
+    """
+    if len(word) > 3 and not word.endswith("ss"):
+        if word.endswith("ies"):
+            return word[:-3] + "y"
+        if word.endswith("s"):
+            return word[:-1]
+    return word
+
+
+# Field masks of a term that occurs in no item
+_NO_MATCHES = (0, 0, 0, 0)
+
+# Position of each domain, for per-domain tables kept as lists
+_DOMAIN_INDEX: Dict[Domain, int] = {domain: idx for idx, domain in enumerate(Domain)}
+
+# Common words to ignore in knowledge queries
+_STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "do",
+        "does",
+        "how",
+        "what",
+        "where",
+        "when",
+        "why",
+        "which",
+        "i",
+    }
+)
+
+# Action words and the phrasings that mean the same thing
+_ACTION_VARIATIONS: Dict[str, FrozenSet[str]] = {
+    "create": frozenset({"create", "make", "setup", "set up", "build", "start", "new"}),
+    "use": frozenset({"use", "work with", "utilize", "run"}),
+    "install": frozenset({"install", "download", "get"}),
+}
+# Each variation maps to the actions it is a phrasing of
+_VARIATION_TO_ACTIONS: Dict[str, Tuple[str, ...]] = {
+    variation: tuple(
+        action
+        for action, phrasings in _ACTION_VARIATIONS.items()
+        if variation in phrasings
+    )
+    for variations in _ACTION_VARIATIONS.values()
+    for variation in variations
+}
+
+# Queries mentioning any of these words are about the project itself
+_PROJECT_TERMS = frozenset(
+    {
+        "project",
+        "chatbot",
+        "assistant",
+        "feature",
+        "dinesh",
+        "capabilities",
+        "bot",
+        "system",
+        "functionality",
+    }
+)
+# Multi-word project terms, matched as phrases
+_PROJECT_PHRASES = ("this project",)
+
+# Keywords that mark a query as being about a domain
+_DOMAIN_KEYWORDS: Dict[Domain, FrozenSet[str]] = {
+    Domain.GITHUB: frozenset({"github", "git", "repo", "pull request", "issue"}),
+    Domain.PYTHON: frozenset(
+        {
+            "python",
+            "pip",
+            "package",
+            "library",
+            "module",
+            "feature",
+            "class",
+            "function",
+            "method",
+            "decorator",
+            "async",
+            "generator",
+            "list",
+            "dict",
+            "tuple",
+            "set",
+            "iterator",
+            "comprehension",
+            "exception",
+            "error handling",
+            "context manager",
+            "with",
+            "import",
+            "inheritance",
+            "polymorphism",
+            "encapsulation",
+            "object oriented",
+            "oop",
+        }
+    ),
+    Domain.WEB: frozenset({"api", "endpoint", "http", "rest", "request"}),
+    Domain.CICD: frozenset({"pipeline", "deploy", "build", "test", "continuous"}),
+    Domain.MCP: frozenset({"mcp", "protocol", "server", "context"}),
+}
+# (domain position, single-word keywords, multi-word keywords) per domain
+_DOMAIN_KEYWORD_ROWS: Tuple[
+    Tuple[int, FrozenSet[str], Tuple[str, ...]], ...
+] = tuple(
+    (
+        _DOMAIN_INDEX[domain],
+        frozenset(_stem(keyword) for keyword in keywords if " " not in keyword),
+        tuple(keyword for keyword in keywords if " " in keyword),
+    )
+    for domain, keywords in _DOMAIN_KEYWORDS.items()
+)
+
+# Per-domain keyword weights for ranking equally scored items
+_DOMAIN_RELEVANCE: Dict[Domain, Dict[str, float]] = {
+    Domain.PYTHON: {
+        "python": 2.0,  # Higher weight for primary domain terms
+        "chatbot": 2.0,
+        "nlp": 1.5,
+        "ai": 1.5,
+        "assistant": 1.5,
+        "conversation": 1.0,
+        "response": 1.0,
+        "context": 1.0,
+        "patterns": 0.8,
+        "features": 0.8,
+        "learning": 0.8,
+    },
+    Domain.GITHUB: {
+        "github": 2.0,  # Higher weight for primary domain terms
+        "git": 1.5,
+        "repository": 1.0,
+        "commit": 1.0,
+        "push": 0.8,
+        "pull": 0.8,
+    },
+    Domain.MCP: {
+        "mcp": 2.0,
+        "protocol": 1.0,
+        "server": 0.8,
+        "client": 0.8,
+        "context": 0.8,
+    },
+    Domain.CICD: {
+        "ci": 2.0,
+        "cd": 2.0,
+        "pipeline": 1.0,
+        "build": 0.8,
+        "deploy": 1.0,
+        "test": 0.5,
+    },
+    Domain.WEB: {
+        "api": 1.5,
+        "rest": 1.5,
+        "endpoint": 1.0,
+        "http": 1.0,
+        "web": 1.5,
+        "request": 0.8,
+    },
+}
+
+
+# Built-in knowledge, in search order: (key, domain, topic, description,
+# examples, related topics, common issues, solutions)
+_KNOWLEDGE_SEED: Tuple[
+    Tuple[
+        str,
+        Domain,
+        str,
+        str,
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[str, ...],
+    ],
+    ...,
+] = (
+    # Python Knowledge
+    (
+        "project_setup",
+        Domain.PYTHON,
+        "Project Setup",
+        "This project uses modern Python practices with a clean architecture and comprehensive testing.",
+        (
+            "# Run the tests\npytest tests/",
+            "# Format code\nblack . && isort .",
+            "# Start the chatbot\npython -m src.main",
+        ),
+        ("testing", "code quality", "project structure", "development workflow"),
+        (
+            "Understanding project structure",
+            "Running test suite",
+            "Code formatting",
+            "Getting started",
+        ),
+        (
+            "Review project documentation",
+            "Follow test guidelines",
+            "Use provided tools",
+            "Check example code",
+        ),
+    ),
+    (
+        "fastapi",
+        Domain.PYTHON,
+        "FastAPI Web Framework",
+        "FastAPI is a modern, fast web framework for building APIs with Python 3.6+ based on standard Python type hints. It's designed to be easy to use, fast to code, and ready for production.",
+        (
+            (
+                "# Basic FastAPI application\n"
+                "from fastapi import FastAPI\n\n"
+                "app = FastAPI()\n\n"
+                "@app.get('/')\n"
+                "def root():\n"
+                "    return {'message': 'Hello World'}"
+            ),
+            (
+                "# Path parameters\n"
+                "@app.get('/items/{item_id}')\n"
+                "def read_item(item_id: int):\n"
+                "    return {'item_id': item_id}"
+            ),
+            (
+                "# Query parameters\n"
+                "@app.get('/search/')\n"
+                "def search(q: str, skip: int = 0, limit: int = 10):\n"
+                "    return {'q': q, 'skip': skip, 'limit': limit}"
+            ),
+        ),
+        (
+            "web development",
+            "API design",
+            "async programming",
+            "Pydantic",
+            "OpenAPI/Swagger",
+        ),
+        (
+            "CORS configuration problems",
+            "Dependency injection confusion",
+            "Path operation ordering",
+            "Type hint errors",
+        ),
+        (
+            "Add CORSMiddleware for cross-origin requests",
+            "Use Depends for clean dependency injection",
+            "Order path operations from most specific to least",
+            "Ensure Python type hints are correct",
+        ),
+    ),
+    (
+        "testing",
+        Domain.PYTHON,
+        "Python Testing",
+        "Python testing frameworks and best practices for writing unit tests, integration tests, and ensuring code quality through comprehensive test coverage.",
+        (
+            "# Basic pytest test\ndef test_function():\n    assert add(2, 3) == 5",
+            (
+                "# Fixture example\n"
+                "@pytest.fixture\n"
+                "def test_data():\n"
+                "    return {'key': 'value'}"
+            ),
+            (
+                "# Parametrized test\n"
+                "@pytest.mark.parametrize('input,expected', [(1,2), (2,4)])\n"
+                "def test_double(input, expected):\n"
+                "    assert double(input) == expected"
+            ),
+        ),
+        ("pytest", "unittest", "test coverage", "mocking", "fixtures"),
+        (
+            "Tests not discovering all files",
+            "Fixture scope problems",
+            "Mock side effects",
+            "Coverage reporting issues",
+        ),
+        (
+            "Check pytest.ini configuration",
+            "Adjust fixture scopes appropriately",
+            "Use proper mock return values",
+            "Configure coverage settings correctly",
+        ),
+    ),
+    (
+        "python_features",
+        Domain.PYTHON,
+        "Python Features",
+        (
+            "Python is a versatile language with many powerful features:\n\n"
+            "1. Core Features\n"
+            "   - Easy to read, dynamic typing\n"
+            "   - Built-in data structures (lists, dictionaries, sets)\n"
+            "   - List/Dict comprehensions\n"
+            "   - Iterator and generator support\n\n"
+            "2. Object-Oriented Features\n"
+            "   - Classes and inheritance\n"
+            "   - Encapsulation and polymorphism\n"
+            "   - Method overriding\n"
+            "   - Properties and descriptors\n\n"
+            "3. Advanced Features\n"
+            "   - Decorators for function/class modification\n"
+            "   - Context managers (with statement)\n"
+            "   - Async/await for asynchronous programming\n"
+            "   - Type hints and annotations\n\n"
+            "4. Error Handling\n"
+            "   - Try/except blocks\n"
+            "   - Custom exceptions\n"
+            "   - Context managers for cleanup"
+        ),
+        (
+            (
+                "# List comprehension\n"
+                "numbers = [x * 2 for x in range(5)]\n\n"
+                "# Generator function\n"
+                "def gen():\n"
+                "    yield 1\n"
+                "    yield 2\n\n"
+                "# Class with properties\n"
+                "class Person:\n"
+                "    def __init__(self, name):\n"
+                "        self._name = name\n"
+                "    @property\n"
+                "    def name(self):\n"
+                "        return self._name"
+            ),
+        ),
+        (
+            "object oriented programming",
+            "functional programming",
+            "error handling",
+            "async programming",
+        ),
+        ("Understanding decorators", "Managing imports", "Proper error handling"),
+        (
+            "Read official Python documentation",
+            "Practice with examples",
+            "Use type hints for clarity",
+        ),
+    ),
+    # GitHub Knowledge
+    (
+        "overview",
+        Domain.GITHUB,
+        "GitHub Platform",
+        "GitHub is a web-based platform for version control and collaboration using Git. It provides hosting for software development, enables team collaboration, and offers tools for code review, project management, and automation.",
+        (
+            "git clone https://github.com/username/repository.git",
+            "git push origin main",
+        ),
+        ("version control", "Git", "repositories", "collaboration"),
+        ("Authentication issues", "Repository access", "Merge conflicts"),
+        (
+            "Set up SSH keys",
+            "Check repository permissions",
+            "Follow Git best practices",
+        ),
+    ),
+    (
+        "actions",
+        Domain.GITHUB,
+        "GitHub Actions",
+        "GitHub Actions is an automation platform that enables you to create custom software development workflows directly in your GitHub repository. It's commonly used for CI/CD, testing, and deployment.",
+        (
+            "name: CI\non: [push]\njobs:\n  build:\n    runs-on: ubuntu-latest",
+            "steps:\n  - uses: actions/checkout@v2",
+        ),
+        ("workflows", "CI/CD", "automation", "DevOps"),
+        ("Workflow not triggering", "Action permissions", "Secrets management"),
+        ("Check trigger events", "Verify permissions", "Set repository secrets"),
+    ),
+    (
+        "repositories",
+        Domain.GITHUB,
+        "GitHub Repositories",
+        "Repositories are the fundamental unit of GitHub, containing all of your project's files and revision history. They can be public or private, and include features like issue tracking, pull requests, and project management tools.",
+        (
+            "git init\ngit remote add origin https://github.com/username/repo.git",
+            "git push -u origin main",
+        ),
+        ("Git", "version control", "branches", "collaboration"),
+        ("Repository initialization", "Remote configuration", "Branch management"),
+        (
+            "Follow repository setup guide",
+            "Configure Git properly",
+            "Use branch protection rules",
+        ),
+    ),
+    # MCP Server Knowledge
+    (
+        "integration",
+        Domain.MCP,
+        "MCP Integration",
+        "Model Context Protocol server integration",
+        (
+            "from mcp_client import MCPClient",
+            "client = MCPClient(endpoint='localhost:50051')",
+        ),
+        ("context management", "API", "protocols"),
+        (
+            "Connection failures",
+            "Context synchronization",
+            "Protocol version mismatches",
+        ),
+        ("Check server status", "Update client version", "Verify endpoints"),
+    ),
+    # CI/CD Knowledge
+    (
+        "pipelines",
+        Domain.CICD,
+        "CI/CD Pipelines",
+        "Continuous Integration and Deployment workflows",
+        ("pytest && black . && isort .", "docker build -t myapp ."),
+        ("testing", "deployment", "automation"),
+        ("Failed tests", "Build errors", "Deployment issues"),
+        ("Check test coverage", "Validate dependencies", "Review logs"),
+    ),
+    # Web Development Knowledge
+    (
+        "api_design",
+        Domain.WEB,
+        "API Design",
+        "RESTful API design principles and practices",
+        ("GET /api/v1/users", "POST /api/v1/users/{id}/update"),
+        ("REST", "endpoints", "HTTP methods"),
+        ("Endpoint naming", "Status codes", "Response format"),
+        ("Follow REST conventions", "Use proper status codes", "Document API specs"),
+    ),
+)
 
 
 class KnowledgeBase:
@@ -36,280 +510,105 @@ class KnowledgeBase:
         self.knowledge: Dict[Domain, Dict[str, KnowledgeItem]] = {
             domain: {} for domain in Domain
         }
+        # Lowercased search fields, one entry per item in knowledge order
+        self._items: List[KnowledgeItem] = []
+        self._domain_indexes: List[int] = []
+        self._topics_lc: List[str] = []
+        self._descs_lc: List[str] = []
+        self._examples_lc_joined: List[str] = []
+        self._related_lc_joined: List[str] = []
+        # Inverted index per field: word -> bitmask of item positions
+        self._field_indexes: Tuple[Dict[str, int], ...] = ({}, {}, {}, {})
+        # Words of any field, to rule out unmatched words with one lookup
+        self._all_words: Set[str] = set()
+        # Adjacent word pairs of topics and descriptions -> bitmask of positions
+        self._pair_indexes: Tuple[Dict[Tuple[str, str], int], ...] = ({}, {})
         self._initialize_knowledge()
+        # Per-instance memo of rankings by lowercased query
+        self._search_cached = lru_cache(maxsize=256)(self._search)
 
     def _initialize_knowledge(self):
         """Initialize the knowledge base with domain-specific information."""
-        # Python Knowledge
-        self._add_python_knowledge()
-        # GitHub Knowledge
-        self._add_github_knowledge()
-        # MCP Server Knowledge
-        self._add_mcp_knowledge()
-        # CI/CD Knowledge
-        self._add_cicd_knowledge()
-        # Web Development Knowledge
-        self._add_web_knowledge()
-
-    def _add_python_knowledge(self):
-        """Add Python-specific knowledge."""
-        self.knowledge[Domain.PYTHON].update(
-            {
-                "project_setup": KnowledgeItem(
-                    domain=Domain.PYTHON,
-                    topic="Project Setup",
-                    description="This project uses modern Python practices with a clean architecture and comprehensive testing.",
-                    examples=[
-                        "# Run the tests\npytest tests/",
-                        "# Format code\nblack . && isort .",
-                        "# Start the chatbot\npython -m src.main",
-                    ],
-                    related_topics=[
-                        "testing",
-                        "code quality",
-                        "project structure",
-                        "development workflow"
-                    ],
-                    common_issues=[
-                        "Understanding project structure",
-                        "Running test suite",
-                        "Code formatting",
-                        "Getting started"
-                    ],
-                    solutions=[
-                        "Review project documentation",
-                        "Follow test guidelines",
-                        "Use provided tools",
-                        "Check example code"
-                    ],
-                ),
-                "fastapi": KnowledgeItem(
-                    domain=Domain.PYTHON,
-                    topic="FastAPI Web Framework",
-                    description="FastAPI is a modern, fast web framework for building APIs with Python 3.6+ based on standard Python type hints. It's designed to be easy to use, fast to code, and ready for production.",
-                    examples=[
-                        "# Basic FastAPI application\nfrom fastapi import FastAPI\n\napp = FastAPI()\n\n@app.get('/')\ndef root():\n    return {'message': 'Hello World'}",
-                        "# Path parameters\n@app.get('/items/{item_id}')\ndef read_item(item_id: int):\n    return {'item_id': item_id}",
-                        "# Query parameters\n@app.get('/search/')\ndef search(q: str, skip: int = 0, limit: int = 10):\n    return {'q': q, 'skip': skip, 'limit': limit}",
-                    ],
-                    related_topics=[
-                        "web development",
-                        "API design",
-                        "async programming",
-                        "Pydantic",
-                        "OpenAPI/Swagger",
-                    ],
-                    common_issues=[
-                        "CORS configuration problems",
-                        "Dependency injection confusion",
-                        "Path operation ordering",
-                        "Type hint errors",
-                    ],
-                    solutions=[
-                        "Add CORSMiddleware for cross-origin requests",
-                        "Use Depends for clean dependency injection",
-                        "Order path operations from most specific to least",
-                        "Ensure Python type hints are correct",
-                    ],
-                ),
-                "testing": KnowledgeItem(
-                    domain=Domain.PYTHON,
-                    topic="Python Testing",
-                    description="Python testing frameworks and best practices for writing unit tests, integration tests, and ensuring code quality through comprehensive test coverage.",
-                    examples=[
-                        "# Basic pytest test\ndef test_function():\n    assert add(2, 3) == 5",
-                        "# Fixture example\n@pytest.fixture\ndef test_data():\n    return {'key': 'value'}",
-                        "# Parametrized test\n@pytest.mark.parametrize('input,expected', [(1,2), (2,4)])\ndef test_double(input, expected):\n    assert double(input) == expected",
-                    ],
-                    related_topics=[
-                        "pytest",
-                        "unittest",
-                        "test coverage",
-                        "mocking",
-                        "fixtures",
-                    ],
-                    common_issues=[
-                        "Tests not discovering all files",
-                        "Fixture scope problems",
-                        "Mock side effects",
-                        "Coverage reporting issues",
-                    ],
-                    solutions=[
-                        "Check pytest.ini configuration",
-                        "Adjust fixture scopes appropriately",
-                        "Use proper mock return values",
-                        "Configure coverage settings correctly",
-                    ],
-                ),
-            }
-        )
-
-    def _add_github_knowledge(self):
-        """Add GitHub-specific knowledge."""
-        self.knowledge[Domain.GITHUB].update(
-            {
-                "overview": KnowledgeItem(
-                    domain=Domain.GITHUB,
-                    topic="GitHub Platform",
-                    description=(
-                        "GitHub is a web-based platform for version control and collaboration using Git. "
-                        "It provides hosting for software development, enables team collaboration, "
-                        "and offers tools for code review, project management, and automation."
-                    ),
-                    examples=[
-                        "git clone https://github.com/username/repository.git",
-                        "git push origin main",
-                    ],
-                    related_topics=[
-                        "version control",
-                        "Git",
-                        "repositories",
-                        "collaboration",
-                    ],
-                    common_issues=[
-                        "Authentication issues",
-                        "Repository access",
-                        "Merge conflicts",
-                    ],
-                    solutions=[
-                        "Set up SSH keys",
-                        "Check repository permissions",
-                        "Follow Git best practices",
-                    ],
-                ),
-                "actions": KnowledgeItem(
-                    domain=Domain.GITHUB,
-                    topic="GitHub Actions",
-                    description=(
-                        "GitHub Actions is an automation platform that enables you to create custom "
-                        "software development workflows directly in your GitHub repository. "
-                        "It's commonly used for CI/CD, testing, and deployment."
-                    ),
-                    examples=[
-                        "name: CI\non: [push]\njobs:\n  build:\n    runs-on: ubuntu-latest",
-                        "steps:\n  - uses: actions/checkout@v2",
-                    ],
-                    related_topics=[
-                        "workflows",
-                        "CI/CD",
-                        "automation",
-                        "DevOps",
-                    ],
-                    common_issues=[
-                        "Workflow not triggering",
-                        "Action permissions",
-                        "Secrets management",
-                    ],
-                    solutions=[
-                        "Check trigger events",
-                        "Verify permissions",
-                        "Set repository secrets",
-                    ],
-                ),
-                "repositories": KnowledgeItem(
-                    domain=Domain.GITHUB,
-                    topic="GitHub Repositories",
-                    description=(
-                        "Repositories are the fundamental unit of GitHub, containing all of your project's files "
-                        "and revision history. They can be public or private, and include features like "
-                        "issue tracking, pull requests, and project management tools."
-                    ),
-                    examples=[
-                        "git init\ngit remote add origin https://github.com/username/repo.git",
-                        "git push -u origin main",
-                    ],
-                    related_topics=[
-                        "Git",
-                        "version control",
-                        "branches",
-                        "collaboration",
-                    ],
-                    common_issues=[
-                        "Repository initialization",
-                        "Remote configuration",
-                        "Branch management",
-                    ],
-                    solutions=[
-                        "Follow repository setup guide",
-                        "Configure Git properly",
-                        "Use branch protection rules",
-                    ],
-                ),
-            }
-        )
+        for key, domain, topic, description, *details in _KNOWLEDGE_SEED:
+            self.knowledge[domain][key] = KnowledgeItem(
+                domain, topic, description, *details
+            )
 
-    def _add_mcp_knowledge(self):
-        """Add MCP Server-specific knowledge."""
-        self.knowledge[Domain.MCP].update(
-            {
-                "integration": KnowledgeItem(
-                    domain=Domain.MCP,
-                    topic="MCP Integration",
-                    description="Model Context Protocol server integration",
-                    examples=[
-                        "from mcp_client import MCPClient",
-                        "client = MCPClient(endpoint='localhost:50051')",
-                    ],
-                    related_topics=["context management", "API", "protocols"],
-                    common_issues=[
-                        "Connection failures",
-                        "Context synchronization",
-                        "Protocol version mismatches",
-                    ],
-                    solutions=[
-                        "Check server status",
-                        "Update client version",
-                        "Verify endpoints",
-                    ],
-                )
-            }
+        for items in self.knowledge.values():
+            for item in items.values():
+                self._index_item(item)
+
+        # Reply to every query about the project itself, shared between calls
+        self._project_features_item = KnowledgeItem(
+            domain=Domain.PYTHON,
+            topic="Project Features",
+            description=(
+                "This project is a smart chatbot assistant with the following features:\n\n"
+                "1. Natural Language Processing\n"
+                "   - Understands user queries\n"
+                "   - Provides context-aware responses\n"
+                "   - Handles multiple topics\n\n"
+                "2. Knowledge Domains\n"
+                "   - Python development\n"
+                "   - GitHub and version control\n"
+                "   - Web development\n"
+                "   - CI/CD and deployment\n\n"
+                "3. Core Features\n"
+                "   • Smart Response Generation\n"
+                "   • Topic-Based Processing\n"
+                "   • Context Management\n"
+                "   • Pattern Recognition"
+                "4. Web Interface\n"
+                "   - FastAPI backend\n"
+                "   - Interactive chat UI\n"
+                "   - Real-time responses"
+            ),
+            examples=(),
+            related_topics=("chatbot", "python", "web development", "testing"),
+            common_issues=("Response accuracy", "Query understanding"),
+            solutions=("Provide specific questions", "Use clear keywords"),
         )
 
-    def _add_cicd_knowledge(self):
-        """Add CI/CD-specific knowledge."""
-        self.knowledge[Domain.CICD].update(
-            {
-                "pipelines": KnowledgeItem(
-                    domain=Domain.CICD,
-                    topic="CI/CD Pipelines",
-                    description="Continuous Integration and Deployment workflows",
-                    examples=[
-                        "pytest && black . && isort .",
-                        "docker build -t myapp .",
-                    ],
-                    related_topics=["testing", "deployment", "automation"],
-                    common_issues=["Failed tests", "Build errors", "Deployment issues"],
-                    solutions=[
-                        "Check test coverage",
-                        "Validate dependencies",
-                        "Review logs",
-                    ],
-                )
-            }
+    def _index_item(self, item: KnowledgeItem) -> None:
+        """Append an item's lowercased search fields to the index."""
+        self._items.append(item)
+        self._domain_indexes.append(_DOMAIN_INDEX[item.domain])
+
+        bit = 1 << (len(self._items) - 1)
+        fields = zip(self._field_indexes, self._field_texts(), item.search_fields)
+        for index, texts, text in fields:
+            texts.append(text)
+            for word in {_stem(word) for word in _WORD_RE.findall(text)}:
+                index[word] = index.get(word, 0) | bit
+                self._all_words.add(word)
+
+        for pair_index, text in zip(self._pair_indexes, item.search_fields):
+            words = [_stem(word) for word in _WORD_RE.findall(text)]
+            for pair in set(zip(words, words[1:])):
+                pair_index[pair] = pair_index.get(pair, 0) | bit
+
+    def _field_texts(self) -> Tuple[List[str], ...]:
+        """Return the lowercased field lists, in the order of the field indexes."""
+        return (
+            self._topics_lc,
+            self._descs_lc,
+            self._examples_lc_joined,
+            self._related_lc_joined,
         )
 
-    def _add_web_knowledge(self):
-        """Add Web Development-specific knowledge."""
-        self.knowledge[Domain.WEB].update(
-            {
-                "api_design": KnowledgeItem(
-                    domain=Domain.WEB,
-                    topic="API Design",
-                    description="RESTful API design principles and practices",
-                    examples=["GET /api/v1/users", "POST /api/v1/users/{id}/update"],
-                    related_topics=["REST", "endpoints", "HTTP methods"],
-                    common_issues=[
-                        "Endpoint naming",
-                        "Status codes",
-                        "Response format",
-                    ],
-                    solutions=[
-                        "Follow REST conventions",
-                        "Use proper status codes",
-                        "Document API specs",
-                    ],
-                )
-            }
+    def _field_masks(self, term: str) -> Tuple[int, ...]:
+        """Return bitmasks of the items whose topic, description, examples
+        and related topics contain ``term``, as a whole word if it is one."""
+        if _WORD_RE.fullmatch(term):
+            term = _stem(term)
+            # Most query words occur in no item; one lookup settles those
+            if term not in self._all_words:
+                return _NO_MATCHES
+            return tuple(index.get(term, 0) for index in self._field_indexes)
+        # Phrases and other non-words are matched as plain substrings
+        return tuple(
+            sum(1 << idx for idx, text in enumerate(texts) if term in text)
+            for texts in self._field_texts()
         )
 
     def get_knowledge(self, domain: Domain, topic: str) -> Optional[KnowledgeItem]:
@@ -318,329 +617,139 @@ class KnowledgeBase:
 
     def search_knowledge(self, query: str) -> List[KnowledgeItem]:
         """Search knowledge base for relevant items."""
-        results = []
-        query = query.lower()
-        query_words = set(query.split())
+        return list(self._search_cached(query.lower()))
+
+    def _search(self, query: str) -> Tuple[KnowledgeItem, ...]:
+        """Rank the items matching a lowercased query, best first."""
+        results: List[Tuple[float, float, int]] = []
+        word_list = query.split()
+
+        logger.debug("Processing query: %s", query)
+        logger.debug("Query words: %s", word_list)
 
-        print(f"\nProcessing query: {query}")
-        print(f"Query words: {query_words}")
+        token_list = _WORD_RE.findall(query)
+        query_tokens = set(token_list)
+
+        # First check if it's a project-specific query
+        if not _PROJECT_TERMS.isdisjoint(query_tokens) or any(
+            phrase in query for phrase in _PROJECT_PHRASES
+        ):
+            return (self._project_features_item,)
 
         # Common words to ignore
-        stop_words = {
-            "a",
-            "an",
-            "the",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "do",
-            "does",
-            "how",
-            "what",
-            "where",
-            "when",
-            "why",
-            "which",
-            "i",
-        }
-        query_words = {word for word in query_words if word not in stop_words}
+        all_words = set(word_list)
+        # Whole words only, so "py" no longer matches inside "pytest"
+        query_words = query_tokens - _STOP_WORDS
 
-        # Add common action variations and expand query words
-        action_variations = {
-            "create": ["create", "make", "setup", "set up", "build", "start", "new"],
-            "use": ["use", "work with", "utilize", "run"],
-            "install": ["install", "download", "get"],
-        }
+        # Expand query words with common action variations
         expanded_query_words = set(query_words)
-
-        # Expand query words with variations
         for word in query_words:
-            for action, variations in action_variations.items():
-                if word in variations:
-                    expanded_query_words.add(action)
-                    expanded_query_words.update(variations)
+            for action in _VARIATION_TO_ACTIONS.get(word, ()):
+                expanded_query_words.add(action)
+                expanded_query_words.update(_ACTION_VARIATIONS[action])
 
         query_words = expanded_query_words
 
-        # Project-specific terms
-        project_terms = {
-            "project",
-            "chatbot",
-            "assistant",
-            "feature",
-            "dinesh",
-            "capabilities",
-            "this project",
-            "bot",
-            "system",
-            "functionality",
-        }
-
-        # Word pairs for better context
-        word_list = query.split()
-        word_pairs = [
-            f"{word_list[i]} {word_list[i + 1]}" for i in range(len(word_list) - 1)
-        ]
-
-        print(f"Word pairs: {word_pairs}")
-
-        # Convert query to lowercase for matching
-        query_lower = query.lower()
+        # Word pairs for better context, stemmed like the pair indexes
+        stems = [_stem(token) for token in token_list]
+        word_pairs = list(zip(stems, stems[1:]))
 
-        # First check if it's a project-specific query
-        if any(term in query_lower for term in project_terms):
-            return [
-                KnowledgeItem(
-                    domain=Domain.PYTHON,
-                    topic="Project Features",
-                    description=(
-                        "This project is a smart chatbot assistant with the following features:\n\n"
-                        "1. Natural Language Processing\n"
-                        "   - Understands user queries\n"
-                        "   - Provides context-aware responses\n"
-                        "   - Handles multiple topics\n\n"
-                        "2. Knowledge Domains\n"
-                        "   - Python development\n"
-                        "   - GitHub and version control\n"
-                        "   - Web development\n"
-                        "   - CI/CD and deployment\n\n"
-                        "3. Core Features\n"
-                        "   • Smart Response Generation\n"
-                        "   • Topic-Based Processing\n"
-                        "   • Context Management\n"
-                        "   • Pattern Recognition"
-                        "4. Web Interface\n"
-                        "   - FastAPI backend\n"
-                        "   - Interactive chat UI\n"
-                        "   - Real-time responses"
-                    ),
-                    examples=[],
-                    related_topics=["chatbot", "python", "web development", "testing"],
-                    common_issues=["Response accuracy", "Query understanding"],
-                    solutions=["Provide specific questions", "Use clear keywords"],
-                )
-            ]
+        logger.debug("Word pairs: %s", word_pairs)
 
         # First, determine which domain the query is most likely about
-        domain_scores = {domain: 0 for domain in Domain}
-        query_lower = query.lower()
+        # Per-domain tables are lists indexed by _DOMAIN_INDEX
+        domain_scores = [0] * len(_DOMAIN_INDEX)
 
         # Score each domain based on keyword presence
-        domain_keywords = {
-            Domain.GITHUB: set(["github", "git", "repo", "pull request", "issue"]),
-            Domain.PYTHON: set(
-                [
-                    "python",
-                    "pip",
-                    "package",
-                    "library",
-                    "module",
-                    "feature",
-                    "class",
-                    "function",
-                    "method",
-                    "decorator",
-                    "async",
-                    "generator",
-                    "list",
-                    "dict",
-                    "tuple",
-                    "set",
-                    "iterator",
-                    "comprehension",
-                    "exception",
-                    "error handling",
-                    "context manager",
-                    "with",
-                    "import",
-                    "inheritance",
-                    "polymorphism",
-                    "encapsulation",
-                    "object oriented",
-                    "oop",
-                ]
-            ),
-            Domain.WEB: set(["api", "endpoint", "http", "rest", "request"]),
-            Domain.CICD: set(["pipeline", "deploy", "build", "test", "continuous"]),
-            Domain.MCP: set(["mcp", "protocol", "server", "context"]),
-        }
-
-        # Initialize Python features knowledge if not exists
-        if "python_features" not in self.knowledge[Domain.PYTHON]:
-            self.knowledge[Domain.PYTHON]["python_features"] = KnowledgeItem(
-                domain=Domain.PYTHON,
-                topic="Python Features",
-                description=(
-                    "Python is a versatile language with many powerful features:\n\n"
-                    "1. Core Features\n"
-                    "   - Easy to read, dynamic typing\n"
-                    "   - Built-in data structures (lists, dictionaries, sets)\n"
-                    "   - List/Dict comprehensions\n"
-                    "   - Iterator and generator support\n\n"
-                    "2. Object-Oriented Features\n"
-                    "   - Classes and inheritance\n"
-                    "   - Encapsulation and polymorphism\n"
-                    "   - Method overriding\n"
-                    "   - Properties and descriptors\n\n"
-                    "3. Advanced Features\n"
-                    "   - Decorators for function/class modification\n"
-                    "   - Context managers (with statement)\n"
-                    "   - Async/await for asynchronous programming\n"
-                    "   - Type hints and annotations\n\n"
-                    "4. Error Handling\n"
-                    "   - Try/except blocks\n"
-                    "   - Custom exceptions\n"
-                    "   - Context managers for cleanup"
-                ),
-                examples=[
-                    "# List comprehension\nnumbers = [x * 2 for x in range(5)]\n\n"
-                    "# Generator function\ndef gen():\n    yield 1\n    yield 2\n\n"
-                    "# Class with properties\nclass Person:\n    def __init__(self, name):\n"
-                    "        self._name = name\n    @property\n    def name(self):\n"
-                    "        return self._name"
-                ],
-                related_topics=[
-                    "object oriented programming",
-                    "functional programming",
-                    "error handling",
-                    "async programming",
-                ],
-                common_issues=[
-                    "Understanding decorators",
-                    "Managing imports",
-                    "Proper error handling",
-                ],
-                solutions=[
-                    "Read official Python documentation",
-                    "Practice with examples",
-                    "Use type hints for clarity",
-                ],
-            )
+        for domain_idx, words, phrases in _DOMAIN_KEYWORD_ROWS:
+            if not words.isdisjoint(stems) or any(
+                phrase in query for phrase in phrases
+            ):
+                # High priority for domain-specific queries
+                domain_scores[domain_idx] = 2
+
+        # Relevance depends on the domain only, so rate each domain once
+        domain_relevance = [
+            self._calculate_domain_relevance(all_words, domain) for domain in Domain
+        ]
 
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                domain_scores[domain] = 2  # High priority for domain-specific queries
+        # Look up which items each term occurs in, per field
+        query_masks = self._field_masks(query)
+        word_masks = {word: self._field_masks(word) for word in query_words}
+        topic_pairs, desc_pairs = self._pair_indexes
+        pair_masks = [
+            (topic_pairs.get(pair, 0), desc_pairs.get(pair, 0)) for pair in word_pairs
+        ]
 
-        # Search through items with domain awareness
-        for domain, items in self.knowledge.items():
-            domain_multiplier = domain_scores[domain] or 1.0
-            for item in items.values():
-                score = 0
-                topic_lower = item.topic.lower()
-                desc_lower = item.description.lower()
-
-                # Direct matches in topic or description with domain awareness
-                if query in topic_lower:
-                    score += 10 * domain_multiplier
-                if query in desc_lower:
-                    score += 8 * domain_multiplier
-
-                # Word matching with emphasis on action words and topics
-                for word in query_words:
-                    # Topic matches with higher weight for the actual query words
-                    if word in topic_lower:
-                        score += 5  # Base score for any topic match
-                        if word in query_words:
-                            score += (
-                                3  # Additional score if it matches the actual query
-                            )
-                    # Description matches with higher score for query-specific terms
-                    if word in desc_lower:
-                        if word in action_variations:
-                            score += 3  # Score for action words
-                        elif word in query_words:
-                            score += 2  # Score for query-specific terms
-                        else:
-                            score += 1
-                    # Example matches
-                    if any(word in ex.lower() for ex in item.examples):
+        # Only items containing the query, a query word or a pair can score
+        candidates = query_masks[0] | query_masks[1]
+        for masks in word_masks.values():
+            candidates |= masks[0] | masks[1] | masks[2] | masks[3]
+        for masks in pair_masks:
+            candidates |= masks[0] | masks[1]
+
+        # Search through items with domain awareness, in knowledge order
+        while candidates:
+            lowest = candidates & -candidates
+            candidates ^= lowest
+            idx = lowest.bit_length() - 1
+            item = self._items[idx]
+            domain_idx = self._domain_indexes[idx]
+            domain_multiplier = domain_scores[domain_idx] or 1.0
+            score = 0
+
+            # Direct matches in topic or description with domain awareness
+            if query_masks[0] & lowest:
+                score += 10 * domain_multiplier
+            if query_masks[1] & lowest:
+                score += 8 * domain_multiplier
+
+            # Word matching with emphasis on action words and topics
+            for word, masks in word_masks.items():
+                in_topic, in_desc, in_examples, in_related = masks
+                # Topic matches with higher weight for the actual query words
+                if in_topic & lowest:
+                    score += 5  # Base score for any topic match
+                    if word in query_words:
+                        score += (
+                            3  # Additional score if it matches the actual query
+                        )
+                # Description matches with higher score for query-specific terms
+                if in_desc & lowest:
+                    if word in _ACTION_VARIATIONS:
+                        score += 3  # Score for action words
+                    elif word in query_words:
+                        score += 2  # Score for query-specific terms
+                    else:
                         score += 1
-                    # Related topic matches
-                    if any(word in topic.lower() for topic in item.related_topics):
-                        score += 2
-
-                # Pair matching for better context
-                for pair in word_pairs:
-                    if pair in topic_lower:
-                        score += 5
-                    if pair in desc_lower:
-                        score += 4
-
-                if score > 0:
-                    print(f"Match: {item.topic} (Score: {score})")
-                    item_data = {
-                        "item": item,
-                        "score": score,
-                        "domain_relevance": self._calculate_domain_relevance(
-                            query, item.domain
-                        ),
-                    }
-                    results.append(item_data)
-
-        # Sort by score and domain relevance
-        sorted_results = sorted(
-            results, key=lambda x: (x["score"], x["domain_relevance"]), reverse=True
-        )
-
-        # Return just the items in sorted order
-        return [item_data["item"] for item_data in sorted_results]
-
-    def _calculate_domain_relevance(self, query: str, domain: Domain) -> float:
-        """Calculate how relevant a domain is to the query."""
-        domain_keywords = {
-            Domain.PYTHON: {
-                "python": 2.0,  # Higher weight for primary domain terms
-                "chatbot": 2.0,
-                "nlp": 1.5,
-                "ai": 1.5,
-                "assistant": 1.5,
-                "conversation": 1.0,
-                "response": 1.0,
-                "context": 1.0,
-                "patterns": 0.8,
-                "features": 0.8,
-                "learning": 0.8,
-            },
-            Domain.GITHUB: {
-                "github": 2.0,  # Higher weight for primary domain terms
-                "git": 1.5,
-                "repository": 1.0,
-                "commit": 1.0,
-                "push": 0.8,
-                "pull": 0.8,
-            },
-            Domain.MCP: {
-                "mcp": 2.0,
-                "protocol": 1.0,
-                "server": 0.8,
-                "client": 0.8,
-                "context": 0.8,
-            },
-            Domain.CICD: {
-                "ci": 2.0,
-                "cd": 2.0,
-                "pipeline": 1.0,
-                "build": 0.8,
-                "deploy": 1.0,
-                "test": 0.5,
-            },
-            Domain.WEB: {
-                "api": 1.5,
-                "rest": 1.5,
-                "endpoint": 1.0,
-                "http": 1.0,
-                "web": 1.5,
-                "request": 0.8,
-            },
-        }
-
-        query_words = set(query.lower().split())
-        domain_dict = domain_keywords.get(domain, {})
+                # Example matches
+                if in_examples & lowest:
+                    score += 1
+                # Related topic matches
+                if in_related & lowest:
+                    score += 2
+
+            # Pair matching for better context
+            for in_topic, in_desc in pair_masks:
+                if in_topic & lowest:
+                    score += 5
+                if in_desc & lowest:
+                    score += 4
+
+            if score > 0:
+                logger.debug("Match: %s (Score: %s)", item.topic, score)
+                # Negated positions keep equally ranked items in knowledge order
+                results.append((score, domain_relevance[domain_idx], -idx))
+
+        # Sort by score and domain relevance, then return just the items
+        results.sort(reverse=True)
+        return tuple(self._items[-neg_idx] for _, _, neg_idx in results)
+
+    def _calculate_domain_relevance(
+        self, query_words: Set[str], domain: Domain
+    ) -> float:
+        """Calculate how relevant a domain is to the lowercased query words."""
+        domain_dict = _DOMAIN_RELEVANCE.get(domain, {})
 
         # Calculate weighted score for matching words
         score = sum(domain_dict.get(word, 0) for word in query_words)
@@ -2,9 +2,13 @@
 Training configuration and response patterns for Dinesh Assistant.
 """
 
-from dataclasses import dataclass
+import random
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+
+_FORMATTER = Formatter()
 
 
 class ResponseType(Enum):
@@ -40,6 +44,10 @@ class TrainingConfig:
             }
 
 
+# One run of Formatter.parse: literal text, field name, format spec, conversion
+_Segment = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
 @dataclass
 class ResponsePattern:
     """Template for generating structured responses."""
@@ -48,6 +56,28 @@ class ResponsePattern:
     template: str
     variables: List[str]
     examples: List[Dict[str, str]]
+    # Runs parsed from the template once, in order
+    _segments: Tuple[_Segment, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Parse the template once so render() doesn't re-scan the braces.
+        self._segments = tuple(_FORMATTER.parse(self.template))
+        fields = {name for _, name, _, _ in self._segments if name is not None}
+        unknown = fields - set(self.variables)
+        if unknown:
+            raise ValueError(f"Template fields {sorted(unknown)} are not in variables")
+
+    def render(self, **values: Any) -> str:
+        """Fill the template, as ``template.format(**values)`` would."""
+        parts = []
+        for literal, name, format_spec, conversion in self._segments:
+            parts.append(literal)
+            if name is not None:
+                value = values[name]
+                if conversion:
+                    value = _FORMATTER.convert_field(value, conversion)
+                parts.append(format(value, format_spec or ""))
+        return "".join(parts)
 
 
 class ResponsePatternLibrary:
@@ -153,7 +183,5 @@ class ResponsePatternLibrary:
 
     def get_random_pattern(self, response_type: ResponseType) -> ResponsePattern:
         """Get a random pattern for variety in responses."""
-        import random
-
         patterns = self.patterns[response_type]
         return random.choice(patterns) if patterns else None
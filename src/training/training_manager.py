@@ -3,13 +3,73 @@ Training manager for Dinesh Assistant.
 Coordinates knowledge base and response pattern integration.
 """
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from .conversation_patterns import ConversationEnhancer
+from .keyword_matcher import KeywordMatcher
 from .knowledge_base import Domain, KnowledgeBase, KnowledgeItem
 from .response_patterns import ResponsePatternLibrary, ResponseType, TrainingConfig
 from .openai_knowledge_base import OPENAI_KNOWLEDGE_BASE
 
+# Queries containing any of these skip the knowledge base entirely.
+_HELP_MATCHER = KeywordMatcher(
+    (pattern, True)
+    for pattern in (
+        "help",
+        "how can you help",
+        "what can you help with",
+        "how can you help me",
+        "tell me how you can help",
+        "what can you do",
+        "what do you do",
+        "what can you do for me",
+        "what assistance can you provide",
+        "show me what you can do",
+    )
+)
+
+
+# Triage keywords for _determine_response_type, scanned in one pass. A query
+# falls into every kind whose keywords it contains; the method checks the
+# kinds in priority order.
+_RESPONSE_KIND_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "project": ("feature", "project", "tell me about", "what can", "capability"),
+    "python": (
+        "python",
+        "feature",
+        "features",
+        "what is",
+        "tell me about python",
+        "class",
+        "function",
+        "method",
+        "decorator",
+        "generator",
+        "async",
+        "context manager",
+        "exception",
+        "inheritance",
+        "polymorphism",
+    ),
+    "troubleshoot": (
+        "error",
+        "issue",
+        "problem",
+        "fix",
+        "help",
+        "wrong",
+        "not working",
+        "failed",
+    ),
+    "howto": ("how", "create", "setup", "set up", "configure", "install", "make"),
+    "example": ("example", "sample", "show", "code", "demonstrate"),
+}
+_RESPONSE_KIND_MATCHER = KeywordMatcher(
+    (keyword, kind)
+    for kind, keywords in _RESPONSE_KIND_KEYWORDS.items()
+    for keyword in keywords
+)
+
 
 class TrainingManager:
     """Manages the training and response generation for the assistant."""
@@ -31,10 +91,10 @@ class TrainingManager:
                         topic=item["topic"],
                         description=item["description"],
                         domain=domain,
-                        examples=item.get("examples", []),
-                        related_topics=[],
-                        common_issues=[],
-                        solutions=[]
+                        examples=tuple(item.get("examples", ())),
+                        related_topics=(),
+                        common_issues=(),
+                        solutions=()
                     )
                 )
         print("OpenAI knowledge integration complete")
@@ -123,19 +183,7 @@ class TrainingManager:
             }
 
         # Skip training manager for help queries
-        help_patterns = {
-            "help",
-            "how can you help",
-            "what can you help with",
-            "how can you help me",
-            "tell me how you can help",
-            "what can you do",
-            "what do you do",
-            "what can you do for me",
-            "what assistance can you provide",
-            "show me what you can do"
-        }
-        if any(pattern in query_lower for pattern in help_patterns):
+        if _HELP_MATCHER.find(query_lower):
             return {
                 "response": (
                     "I'm your dedicated assistant for this project! Here's what I can do for you:\n\n"
@@ -185,13 +233,11 @@ class TrainingManager:
         topics = self._get_related_topics(relevant_items)
         print(f"Found {len(topics)} related topics")  # Debug log
 
-        # For non-help queries, enhance the response
-        enhanced_response = response
-        if not any(pattern in query_lower for pattern in help_patterns):
-            enhanced_response = self.conversation_enhancer.enhance_response(
-                response, query, topics[0] if topics else None
-            )
-            print(f"Enhanced response: {enhanced_response[:100]}...")  # Debug log
+        # Help queries returned above, so this is a non-help query: enhance it
+        enhanced_response = self.conversation_enhancer.enhance_response(
+            response, query, topics[0] if topics else None
+        )
+        print(f"Enhanced response: {enhanced_response[:100]}...")  # Debug log
 
         return {
             "response": enhanced_response,
@@ -204,46 +250,18 @@ class TrainingManager:
     ) -> ResponseType:
         """Determine the most appropriate response type based on query and context."""
         query = query.lower()
-        words = set(query.split())
+        kinds = _RESPONSE_KIND_MATCHER.find(query)
 
         # Print the detected query type for debugging
         print(f"\nAnalyzing query type for: {query}")
 
         # Project feature query
-        project_terms = {
-            "feature",
-            "project",
-            "tell me about",
-            "what can",
-            "capability",
-        }
-        if any(term in query for term in project_terms):
+        if "project" in kinds:
             print("Detected: Project features query")
             return ResponseType.DIRECT
 
         # Python features query
-        python_terms = {
-            "python",
-            "feature",
-            "features",
-            "what is",
-            "tell me about python",
-        }
-        python_features = {
-            "class",
-            "function",
-            "method",
-            "decorator",
-            "generator",
-            "async",
-            "context manager",
-            "exception",
-            "inheritance",
-            "polymorphism",
-        }
-        if any(term in query for term in python_terms) or any(
-            feature in query for feature in python_features
-        ):
+        if "python" in kinds:
             print("Detected: Python features query")
             return ResponseType.DIRECT
 
@@ -257,37 +275,17 @@ class TrainingManager:
                 return ResponseType.DIRECT
 
         # Check for troubleshooting queries
-        troubleshoot_words = {
-            "error",
-            "issue",
-            "problem",
-            "fix",
-            "help",
-            "wrong",
-            "not working",
-            "failed",
-        }
-        if any(word in words or word in query for word in troubleshoot_words):
+        if "troubleshoot" in kinds:
             print("Detected: Troubleshooting query")
             return ResponseType.TROUBLESHOOT
 
         # Check for how-to and creation requests
-        howto_words = {
-            "how",
-            "create",
-            "setup",
-            "set up",
-            "configure",
-            "install",
-            "make",
-        }
-        if any(word in query for word in howto_words):
+        if "howto" in kinds:
             print("Detected: Tutorial/how-to query")
             return ResponseType.TUTORIAL
 
         # Check for example requests
-        example_words = {"example", "sample", "show", "code", "demonstrate"}
-        if any(word in words or word in query for word in example_words):
+        if "example" in kinds:
             print("Detected: Example query")
             return ResponseType.EXAMPLE
 
@@ -310,7 +308,7 @@ class TrainingManager:
         primary_item = items[0]  # Use most relevant item
         try:
             if response_type == ResponseType.EXAMPLE:
-                return pattern.template.format(
+                return pattern.render(
                     topic=primary_item.topic,
                     language=self._determine_language(primary_item),
                     code=(
@@ -322,7 +320,7 @@ class TrainingManager:
                 )
 
             elif response_type == ResponseType.TROUBLESHOOT:
-                return pattern.template.format(
+                return pattern.render(
                     issue=query,
                     check=(
                         primary_item.common_issues[0]
@@ -340,14 +338,14 @@ class TrainingManager:
 
             elif response_type == ResponseType.TUTORIAL:
                 steps = (
-                    primary_item.solutions[:3]
+                    list(primary_item.solutions[:3])
                     if primary_item.solutions
                     else ["Read documentation"]
                 )
                 while len(steps) < 3:
                     steps.append("Practice and experiment")
 
-                return pattern.template.format(
+                return pattern.render(
                     topic=primary_item.topic,
                     step1=steps[0],
                     step2=steps[1],
@@ -438,7 +436,7 @@ class TrainingManager:
 
     def _get_references(self, items: List[KnowledgeItem]) -> List[str]:
         """Get relevant reference topics from knowledge items."""
-        references = []
+        references: List[str] = []
         for item in items:
             references.extend(item.related_topics)
         return list(set(references))  # Remove duplicates
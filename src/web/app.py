@@ -7,13 +7,15 @@ from typing import Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
 from src.chatbot import DineshAssistant
 
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app with additional configuration
 app = FastAPI(
     title="Dinesh Assistant",
@@ -96,14 +98,12 @@ async def health_check() -> Dict:
 async def chat(request: ChatRequest) -> Dict:
     """Handle chat messages."""
     try:
-        query = request.query.lower().strip()
-        print(f"Processing query: {query}")  # Debug log
+        logger.debug("Processing query: %s", request.query)
 
         # Get response from assistant for all queries
-        print("Using assistant for response")  # Debug log
         response = await assistant.respond(request.query)
 
-        print(f"Response received: {response.text[:100]}...")  # Debug log
+        logger.debug("Response received: %.100s...", response.text)
         return {
             "text": response.text,
             "confidence": response.confidence,
@@ -115,6 +115,16 @@ async def chat(request: ChatRequest) -> Dict:
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Stream the answer to a chat message as plain text while it is generated."""
+    logger.debug("Streaming query: %s", request.query)
+    return StreamingResponse(
+        assistant.respond_stream(request.query),
+        media_type="text/plain; charset=utf-8",
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle all uncaught exceptions."""
@@ -127,6 +137,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 
 def start() -> None:
     """Start the web UI server with robust configuration for permanent access."""
+    import importlib.util
     import socket
     import time
 
@@ -156,4 +167,14 @@ def start() -> None:
     print(f"🌐 Access the web interface at: http://localhost:{port}")
     print("⌨️  Press Ctrl+C to stop the server when needed\n")
 
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="debug", reload=True)
+    # Ask for uvloop and httptools by name when they are installed, and fall back
+    # to asyncio/h11 where they are not (uvloop has no Windows build).
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="debug",
+        reload=True,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+    )
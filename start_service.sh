@@ -25,10 +25,12 @@ fi
 # Kill any existing instances
 pkill -f "uvicorn" || true
 pkill -f "monitor_service.py" || true
+# Anchored so network_monitor.py processes are left alone
+pkill -f "python3 monitor\.py" || true
 
 # Start the monitoring service
 echo "Starting service monitor..."
-nohup python3 monitor_service.py > monitor.log 2>&1 &
+nohup python3 monitor.py > monitor.log 2>&1 &
 
 # Wait for the service to start
 echo "Waiting for service to start..."
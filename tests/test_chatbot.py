@@ -1,8 +1,10 @@
 """Tests for Dinesh Assistant chatbot."""
 
+import asyncio
+
 import pytest
 
-from src.chatbot import DineshAssistant, Response
+from src.chatbot import DineshAssistant, Response, _get_openai_client
 
 
 @pytest.fixture
@@ -93,3 +95,228 @@ async def test_context_tracking(assistant):
     assert "features" in response1.text.lower()
     assert response1.confidence > 0.7
     assert response2.confidence > 0.7
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_uses_cache(assistant):
+    """Test that repeated queries are answered from the response cache."""
+    response1 = await assistant.respond("hello")
+    response2 = await assistant.respond("  hello  ")
+
+    assert response2 is response1
+    assert assistant._context["interaction_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bare_greeting_fast_path(assistant):
+    """Test that bare greetings are answered without a network check."""
+
+    def fail_network_check():
+        raise AssertionError("network check should be skipped")
+
+    assistant._check_network = fail_network_check
+    response = await assistant.respond("Hello there!")
+
+    assert response.context["type"] == "greeting"
+    assert assistant._context["interaction_count"] == 1
+
+
+def test_error_query_matches_exception_names(assistant):
+    """Test that error categories match exception names in any case."""
+    response = assistant._handle_error_query("I get a ModuleNotFoundError on start")
+    assert response.context == {"type": "error", "error_type": "import"}
+
+
+def test_error_query_keeps_category_priority(assistant):
+    """Test that the first declared category wins even when matches overlap."""
+    response = assistant._handle_error_query("A TypeError occurred")
+    assert response.context == {"type": "error", "error_type": "runtime"}
+
+
+def test_openai_client_follows_event_loop(monkeypatch):
+    """Test that each event loop gets its own OpenAI client, reused within it."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    async def get_twice():
+        return _get_openai_client(), _get_openai_client()
+
+    first, again = asyncio.run(get_twice())
+    second, _ = asyncio.run(get_twice())
+
+    assert first is again
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_openai_answers_are_cached(assistant):
+    """Test that repeated AI queries reuse the cached OpenAI response."""
+    calls = []
+
+    async def fake_openai_api(prompt):
+        calls.append(prompt)
+        return "Use asyncio.gather to run coroutines concurrently."
+
+    assistant._call_openai_api = fake_openai_api
+    topics = frozenset({"code"})
+    response1 = await assistant._get_openai_response("How?", topics, "python")
+    response2 = await assistant._get_openai_response("how?", topics, "python")
+
+    assert response2 is response1
+    assert len(calls) == 1
+    assert assistant.cache_stats()["hits"] == 1
+    assert assistant.cache_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_prompts_share_one_request(assistant):
+    """Test that identical prompts in flight together make one API call."""
+    calls = []
+
+    async def fake_completion(prompt):
+        calls.append(prompt)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    assistant._request_completion = fake_completion
+    results = await asyncio.gather(
+        assistant._call_openai_api("same prompt"),
+        assistant._call_openai_api("same prompt"),
+        assistant._call_openai_api("other prompt"),
+    )
+
+    assert results == ["answer", "answer", "answer"]
+    assert calls == ["same prompt", "other prompt"]
+    assert assistant._inflight_openai == {}
+
+
+@pytest.mark.asyncio
+async def test_respond_stream_yields_marked_lines(assistant):
+    """Test that streamed OpenAI output arrives as marked, complete lines."""
+
+    async def network_ok():
+        return True
+
+    async def fake_stream(prompt):
+        for chunk in ["Steps:\nUse a ", "venv\n```\nNote: keep\n", "```\ndone"]:
+            yield chunk
+
+    assistant._check_network = network_ok
+    assistant._stream_openai = fake_stream
+    pieces = [piece async for piece in assistant.respond_stream("write a script")]
+
+    assert pieces == [
+        "🔍 Steps:\n",
+        "Use a venv\n",
+        "```\n",
+        "Note: keep\n",
+        "```\n",
+        "done",
+    ]
+    history = assistant._context["conversation_history"]
+    assert history[-1].text == "".join(pieces)
+
+
+@pytest.mark.asyncio
+async def test_respond_stream_routes_like_respond(assistant):
+    """Test that streaming reports offline AI queries and reuses cached answers."""
+
+    async def network_down():
+        return False
+
+    async def network_ok():
+        return True
+
+    async def fake_openai_api(prompt):
+        return "Use a virtual environment."
+
+    async def fail_stream(prompt):
+        raise AssertionError("cached answers should not be streamed again")
+        yield
+
+    assistant._check_network = network_down
+    offline = [piece async for piece in assistant.respond_stream("train a model")]
+    response = await assistant.respond("train a model")
+    assert response.context["type"] == "network_error"
+    assert offline == [response.text]
+
+    assistant._check_network = network_ok
+    assistant._call_openai_api = fake_openai_api
+    answer = await assistant.respond("write a script")
+    history = assistant._context["conversation_history"]
+    assert history[-1].text == answer.text
+    assistant._stream_openai = fail_stream
+    pieces = [piece async for piece in assistant.respond_stream("write a script")]
+
+    assert pieces == [answer.text]
+    assert assistant.cache_stats()["hits"] == 1
+    assert [entry.text for entry in list(history)[-2:]] == [answer.text] * 2
+
+
+@pytest.mark.asyncio
+async def test_respond_stream_records_partial_answer(assistant):
+    """Test that an answer cut off mid-stream still reaches the history."""
+
+    async def network_ok():
+        return True
+
+    async def broken_stream(prompt):
+        yield "First step\n"
+        raise ConnectionError("stream dropped")
+
+    assistant._check_network = network_ok
+    assistant._stream_openai = broken_stream
+    pieces = [piece async for piece in assistant.respond_stream("write a script")]
+
+    assert pieces == ["First step\n"]
+    assert assistant._context["conversation_history"][-1].text == "First step\n"
+    assert not assistant._openai_cache._entries
+
+
+@pytest.mark.asyncio
+async def test_openai_prompt_keeps_history_after_stable_prefix(assistant):
+    """Test that per-turn details only ever follow the shared prompt prefix."""
+    first = assistant._build_openai_prompt("What is pytest?", frozenset(), "testing")
+    await assistant.respond("hello")
+    second = assistant._build_openai_prompt("And async?", frozenset(), "python")
+
+    prefix = first[: first.index("Context:")]
+    assert second.startswith(prefix)
+    assert "Previous topic:" not in first
+    assert "quality assurance" in first
+    assert "quality assurance" not in second
+    assert second.endswith("Previous topic: greeting\n\nUser question: And async?")
+
+
+@pytest.mark.asyncio
+async def test_respond_stream_apologises_on_errors(assistant):
+    """Test that streaming errors yield respond()'s apology, not a cut-off body."""
+
+    async def broken_route(query_lower):
+        raise RuntimeError("routing failed")
+
+    real_route = assistant._route
+    assistant._route = broken_route
+    pieces = [piece async for piece in assistant.respond_stream("write a script")]
+    response = await assistant.respond("write a script")
+    assert response.context["type"] == "error"
+    assert pieces == [response.text]
+
+    async def network_ok():
+        return True
+
+    async def dead_stream(prompt):
+        raise ConnectionError("stream failed")
+        yield
+
+    def broken_local(*args):
+        raise RuntimeError("local answer failed")
+
+    assistant._route = real_route
+    assistant._check_network = network_ok
+    assistant._stream_openai = dead_stream
+    assistant._routed_response = broken_local
+    pieces = [piece async for piece in assistant.respond_stream("write a script")]
+    assert pieces == [
+        "I apologize, but I encountered an error: local answer failed. "
+        "Please try rephrasing your query."
+    ]
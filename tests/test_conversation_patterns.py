@@ -1,5 +1,7 @@
 """Test suite for conversation patterns."""
 
+import pytest
+
 from src.training.conversation_patterns import (
     ConversationContext,
     ConversationEnhancer,
@@ -12,7 +14,7 @@ def test_conversation_context_initialization():
     """Test initialization of ConversationContext."""
     context = ConversationContext()
     assert context.user_name is None
-    assert context.conversation_history == []
+    assert list(context.conversation_history) == []
     assert context.current_topic is None
     assert context.emotion_state == Emotion.NEUTRAL
     assert context.interaction_count == 0
@@ -36,6 +38,14 @@ def test_pattern_library_initialization():
     assert len(library.empathy_patterns["error_encountered"]) > 0
 
 
+def test_pattern_library_tables_are_read_only():
+    """Test that one library cannot change the tables all libraries share."""
+    library = ConversationPatternLibrary()
+    with pytest.raises(TypeError):
+        library.greetings["first_time"] = ("Changed",)
+    assert ConversationPatternLibrary().greetings["first_time"] != ("Changed",)
+
+
 def test_conversation_enhancer_basic_response():
     """Test basic response enhancement."""
     enhancer = ConversationEnhancer()
@@ -113,3 +123,15 @@ def test_conversation_enhancer_farewell():
     assert isinstance(farewell, str)
     assert len(farewell) > 0
     assert str(enhancer.context.interaction_count) in farewell
+
+
+def test_conversation_history_is_bounded():
+    """Test that the conversation history keeps only recent interactions."""
+    enhancer = ConversationEnhancer()
+    for i in range(60):
+        enhancer.update_context(f"query {i}", "response")
+
+    history = enhancer.context.conversation_history
+    assert len(history) == 50
+    assert history[0]["query"] == "query 10"
+    assert history[-1]["query"] == "query 59"
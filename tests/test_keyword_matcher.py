@@ -0,0 +1,62 @@
+"""Tests for the fused keyword matcher."""
+
+import pytest
+
+from src.training.keyword_matcher import KeywordMatcher
+
+
+def naive_find(entries, text):
+    """Reference implementation: one substring check per keyword."""
+    return {value for keyword, value in entries if keyword in text}
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_find_matches_substring_semantics(use_automaton):
+    """Test that the matcher agrees with per-keyword substring checks."""
+    entries = [
+        ("server", "mcp"),
+        ("server", "web"),
+        ("smart server", "mcp"),
+        ("api", "web"),
+        ("fastapi", "web"),
+        ("test", "python"),
+        ("testing", "testing"),
+        ("ab", "x"),
+        ("bc", "y"),
+    ]
+    matcher = KeywordMatcher(entries, use_automaton=use_automaton)
+    queries = [
+        "",
+        "smart server",
+        "fastapi testing",
+        "abc",
+        "the web server answers api calls",
+        "nothing relevant here",
+    ]
+    for query in queries:
+        assert matcher.find(query) == naive_find(entries, query)
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_find_reports_prefix_keywords(use_automaton):
+    """Test that shorter keywords prefixing a longer match are reported."""
+    matcher = KeywordMatcher(
+        [("test", "short"), ("testing", "long")], use_automaton=use_automaton
+    )
+    assert matcher.find("testing") == {"short", "long"}
+
+
+def test_shared_prefixes_match_like_substrings():
+    """Test the trie-shaped fallback regex on keywords sharing prefixes."""
+    entries = [
+        (keyword, keyword)
+        for keyword in ["fast", "fastapi", "fastest", "fa", "a", "api", "st", "t"]
+    ]
+    matcher = KeywordMatcher(entries, use_automaton=False)
+    for query in ["fastapi", "fastest fast", "faster", "a stapi", "f"]:
+        assert matcher.find(query) == naive_find(entries, query)
+
+
+def test_empty_matcher():
+    """Test that a matcher without keywords never matches."""
+    assert KeywordMatcher([]).find("anything") == set()
@@ -0,0 +1,63 @@
+"""Tests for knowledge base search rankings."""
+
+import pytest
+
+from src.training.knowledge_base import KnowledgeBase
+
+
+@pytest.fixture(scope="module")
+def knowledge_base():
+    """Create one knowledge base for all ranking tests."""
+    return KnowledgeBase()
+
+
+def topics(knowledge_base, query):
+    """Return the topics ranked for ``query``, best first."""
+    return [item.topic for item in knowledge_base.search_knowledge(query)]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("docker", ["CI/CD Pipelines"]),
+        ("fixtures", ["Python Testing"]),
+        ("pull request", ["GitHub Repositories"]),
+        ("ci/cd pipeline", ["CI/CD Pipelines", "GitHub Actions"]),
+        ("tell me about this project", ["Project Features"]),
+        ("quantum", []),
+    ],
+)
+def test_search_rankings(knowledge_base, query, expected):
+    """Test the rankings of representative word and phrase queries."""
+    assert topics(knowledge_base, query) == expected
+
+
+def test_search_ignores_case_and_punctuation(knowledge_base):
+    """Test that queries are matched on their lowercased words."""
+    assert topics(knowledge_base, "What is a Decorator?") == topics(
+        knowledge_base, "what is a decorator"
+    )
+
+
+def test_word_pairs_rank_matching_order_first(knowledge_base):
+    """Test that a word pair only scores in the order it appears in an item."""
+    assert topics(knowledge_base, "comprehensive testing")[0] == "Project Setup"
+    assert topics(knowledge_base, "testing comprehensive")[0] == "Python Testing"
+
+
+def test_words_match_whole_words_only(knowledge_base):
+    """Test that word fragments do not match inside longer words."""
+    assert topics(knowledge_base, "py") == []
+    assert topics(knowledge_base, "pyt") == []
+    assert topics(knowledge_base, "hub") == []
+    assert "Project Setup" not in topics(knowledge_base, "set")
+    assert "GitHub Actions" not in topics(knowledge_base, "git")
+
+
+def test_plurals_match_singulars(knowledge_base):
+    """Test that plural and singular query words match the same items."""
+    assert topics(knowledge_base, "what is a decorator")[0] == "Python Features"
+    assert topics(knowledge_base, "python decorators")[0] == "Python Features"
+    assert topics(knowledge_base, "create new repositories") == topics(
+        knowledge_base, "create new repository"
+    )